@@ -19,9 +19,8 @@ from __future__ import annotations
 
 import io
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
-from .backends.pymupdf import PyMuPDFBackend
 from .types import (
     Color,
     LineEndStyle,
@@ -37,6 +36,9 @@ from .types import (
 )
 from .viewer import PdfViewer
 
+if TYPE_CHECKING:
+    from .backends.pymupdf import PyMuPDFBackend
+
 __version__ = "0.1.0"
 
 
@@ -46,7 +48,7 @@ class PdfDocument:
 
     Can be created from:
     - File path (str or Path)
-    - Bytes
+    - Bytes (bytes, bytearray or memoryview, used without copying)
     - BytesIO
 
     Args:
@@ -71,7 +73,7 @@ class PdfDocument:
 
     def __init__(
         self,
-        source: Union[str, Path, bytes, io.BytesIO],
+        source: Union[str, Path, bytes, bytearray, memoryview, io.BytesIO],
         password: Optional[str] = None,
     ):
         """Open a PDF document.
@@ -80,7 +82,10 @@ class PdfDocument:
             source: Path to PDF file, bytes, or BytesIO
             password: Password for encrypted PDFs (optional)
         """
-        self._backend = PyMuPDFBackend(source, password=password)
+        # Imported here so importing the package doesn't load MuPDF
+        from .backends.pymupdf import PyMuPDFBackend
+
+        self._backend: PyMuPDFBackend = PyMuPDFBackend(source, password=password)
 
     @property
     def page_count(self) -> int:
@@ -121,16 +126,21 @@ class PdfDocument:
         """
         return self._backend.permissions
 
-    def extract_fonts(self, assets_dir: Optional[str] = None) -> Dict[str, str]:
+    def extract_fonts(
+        self, assets_dir: Optional[str] = None, to_memory: bool = False
+    ) -> Dict[str, Union[str, bytes]]:
         """Extract embedded fonts from the PDF.
 
         Args:
             assets_dir: Path to Flet assets directory. If provided, fonts are
                        saved to assets/fonts/ with relative paths that work
                        with Flet's page.fonts.
+            to_memory: Return TTF bytes instead of writing font files. Useful
+                       for consumers other than page.fonts, which needs paths.
 
         Returns:
-            Dict mapping font names to font paths for page.fonts.
+            Dict mapping font names to font paths for page.fonts
+            (or to TTF bytes with to_memory=True).
 
         Example:
             document = PdfDocument("file.pdf")
@@ -138,7 +148,7 @@ class PdfDocument:
             page.fonts = fonts
             # Then run with: ft.app(target=main, assets_dir="assets")
         """
-        return self._backend.extract_fonts(assets_dir)
+        return self._backend.extract_fonts(assets_dir, to_memory=to_memory)
 
     @property
     def fonts(self) -> Dict[str, str]:
@@ -256,6 +266,20 @@ class PdfDocument:
         page = self._backend.get_page(page_index)
         page.add_ink(paths, color, width)
 
+    def add_inks_grouped(
+        self,
+        page_index: int,
+        strokes_by_style: Dict[Tuple[Color, float], List[List[Tuple[float, float]]]],
+    ) -> None:
+        """Add many ink strokes, one annotation per (color, width) style.
+
+        Args:
+            page_index: Page number (0-based)
+            strokes_by_style: Maps (color, width) to the strokes drawn with it
+        """
+        page = self._backend.get_page(page_index)
+        page.add_inks_grouped(strokes_by_style)
+
     # Shape annotations
 
     def add_freetext(
@@ -624,9 +648,16 @@ class PdfDocument:
         """
         return self._backend.split_pdf(output_dir, prefix)
 
-    def save(self, path: Optional[Union[str, Path]] = None) -> None:
-        """Save the document."""
-        self._backend.save(path)
+    def save(self, path: Optional[Union[str, Path]] = None, optimize: bool = False) -> None:
+        """Save the document.
+
+        Args:
+            path: Target path; defaults to the file the document was opened from.
+                  Saving back to that file only appends the changes.
+            optimize: Compact the file (drop unused objects, compress streams).
+                      Requires a new path.
+        """
+        self._backend.save(path, optimize=optimize)
 
     def close(self):
         """Close and release resources."""
@@ -3,6 +3,15 @@ PDF backends - abstraction layer for PDF parsing libraries.
 """
 
 from .base import DocumentBackend, PageBackend
-from .pymupdf import PyMuPDFBackend
 
 __all__ = ["DocumentBackend", "PageBackend", "PyMuPDFBackend"]
+
+
+def __getattr__(name: str):
+    # Loading PyMuPDF maps the whole MuPDF library, so it waits until a
+    # backend is actually requested
+    if name == "PyMuPDFBackend":
+        from .pymupdf import PyMuPDFBackend
+
+        return PyMuPDFBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,8 +5,9 @@ Backends must implement these protocols to work with the viewer.
 """
 
 from abc import ABC, abstractmethod
+from array import array
 from pathlib import Path
-from typing import IO, List, Optional, Tuple, Union
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from ..types import (
     AnnotationInfo,
@@ -31,6 +32,9 @@ from ..types import (
 class PageBackend(ABC):
     """Abstract interface for a PDF page."""
 
+    # Empty so implementations can use __slots__ without a __dict__ coming back
+    __slots__ = ()
+
     @property
     @abstractmethod
     def width(self) -> float:
@@ -64,9 +68,43 @@ class PageBackend(ABC):
         """Extract individual characters with positions."""
         ...
 
+    def extract_text_and_chars(self) -> Tuple[List[TextBlock], List[CharInfo]]:
+        """Extract text blocks and characters together.
+
+        Backends may override this to build both from a single traversal of
+        their text layout instead of two.
+        """
+        return self.extract_text_blocks(), self.extract_chars()
+
+    def extract_chars_arrays(self) -> Dict[str, Union[array, str]]:
+        """Extract characters as parallel columns instead of CharInfo objects.
+
+        Hit-testing and selection only need positions, and flat float arrays
+        are much denser than one object per character.
+
+        Returns:
+            Dict with "x", "y", "w", "h" and "size" as array('d') columns and
+            "chars" as a string, all indexed like extract_chars()
+        """
+        chars = self.extract_chars()
+        return {
+            "x": array("d", [c.x for c in chars]),
+            "y": array("d", [c.y for c in chars]),
+            "w": array("d", [c.width for c in chars]),
+            "h": array("d", [c.height for c in chars]),
+            "size": array("d", [c.font_size for c in chars]),
+            "chars": "".join([c.char for c in chars]),
+        }
+
     @abstractmethod
-    def extract_images(self) -> List[ImageInfo]:
-        """Extract images from the page."""
+    def extract_images(self, write_files: bool = True) -> List[ImageInfo]:
+        """Extract images from the page.
+
+        Args:
+            write_files: Whether to write each image to a temp file (png_path).
+                When False, the encoded data is returned in image_bytes instead
+                and nothing touches the disk.
+        """
         ...
 
     @abstractmethod
@@ -84,12 +122,43 @@ class PageBackend(ABC):
         """Get all links on the page."""
         ...
 
+    def get_text(self) -> str:
+        """Get the page's plain text; backends may override with a cheaper path."""
+        return "\n".join(block.text for block in self.extract_text_blocks())
+
+    def iter_graphics(self, viewport: Optional[Rect] = None) -> Iterator[GraphicsInfo]:
+        """Iterate vector graphics; backends may override to extract lazily.
+
+        Args:
+            viewport: Only yield graphics whose bbox intersects this
+                (x0, y0, x1, y1) area, in page points. None yields all.
+        """
+        graphics = self.extract_graphics()
+        if viewport is None:
+            return iter(graphics)
+        vx0, vy0, vx1, vy1 = viewport
+        return (
+            gfx
+            for gfx in graphics
+            for x0, y0, x1, y1 in (gfx.bbox,)
+            if x0 <= vx1 and x1 >= vx0 and y0 <= vy1 and y1 >= vy0
+        )
+
+    def iter_annotations(self) -> Iterator[AnnotationInfo]:
+        """Iterate annotations; backends may override to extract lazily."""
+        return iter(self.get_annotations())
+
+    def iter_links(self) -> Iterator[LinkInfo]:
+        """Iterate links; backends may override to extract lazily."""
+        return iter(self.get_links())
+
     @abstractmethod
     def search_text(
         self,
         query: str,
         case_sensitive: bool = False,
         whole_word: bool = False,
+        need_quads: bool = False,
     ) -> List[SearchResult]:
         """Search for text on this page.
 
@@ -97,12 +166,23 @@ class PageBackend(ABC):
             query: The text to search for
             case_sensitive: Whether search is case-sensitive
             whole_word: Whether to match whole words only
+            need_quads: Whether to fill SearchResult.quads; bounding rects
+                are always returned
 
         Returns:
             List of SearchResult with match locations
         """
         ...
 
+    def search_text_iter(
+        self,
+        query: str,
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+    ) -> Iterator[SearchResult]:
+        """Iterate matches on this page; see search_text for the arguments."""
+        return iter(self.search_text(query, case_sensitive, whole_word))
+
     # Annotation methods
     @abstractmethod
     def add_highlight(self, rects: List[Rect], color: Color) -> None:
@@ -145,6 +225,21 @@ class PageBackend(ABC):
         """Add ink (freehand) annotation."""
         ...
 
+    def add_inks_grouped(
+        self, strokes_by_style: Dict[Tuple[Color, float], List[InkPath]]
+    ) -> None:
+        """Add many ink strokes with one annotation per (color, width) style.
+
+        Each annotation costs an appearance stream rebuild, so strokes that
+        share a style are grouped instead of being added one by one.
+
+        Args:
+            strokes_by_style: Maps (color, width) to the strokes drawn with it
+        """
+        for (color, width), paths in strokes_by_style.items():
+            if paths:
+                self.add_ink(paths, color, width)
+
     # Shape annotations
     @abstractmethod
     def add_freetext(
@@ -292,6 +387,9 @@ class PageBackend(ABC):
 class DocumentBackend(ABC):
     """Abstract interface for a PDF document."""
 
+    # Empty so implementations can use __slots__ without a __dict__ coming back
+    __slots__ = ()
+
     @property
     @abstractmethod
     def page_count(self) -> int:
@@ -303,6 +401,73 @@ class DocumentBackend(ABC):
         """Get a page by index."""
         ...
 
+    def search_text_iter(
+        self,
+        query: str,
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+        start_page: int = 0,
+    ) -> Iterator[SearchResult]:
+        """Search the document page by page, yielding matches as found.
+
+        Later pages are only searched once the caller asks for more, so
+        stopping at the first match skips the rest of the document.
+
+        Args:
+            query: The text to search for
+            case_sensitive: Whether search is case-sensitive
+            whole_word: Whether to match whole words only
+            start_page: Page index to start searching from
+
+        Yields:
+            SearchResult for each match, in page order
+        """
+        for page_index in range(max(0, start_page), self.page_count):
+            page = self.get_page(page_index)
+            yield from page.search_text_iter(query, case_sensitive, whole_word)
+
+    def prefetch_pages(self, indices: Iterable[int]) -> None:
+        """Run page extraction ahead of time so the pages render from cache.
+
+        For the pages a reader is likely to open next. Extraction runs on
+        the calling thread; PyMuPDF isn't thread-safe, so don't call this
+        while another thread uses the document. Out-of-range indices are
+        skipped. Only text, chars and graphics are prepared: images are
+        written to temp files, which isn't worth doing for pages that may
+        never be opened.
+
+        Args:
+            indices: Page indices to prepare, most likely first
+        """
+        for index in indices:
+            if 0 <= index < self.page_count:
+                page = self.get_page(index)
+                page.extract_text_and_chars()
+                page.extract_graphics()
+
+    def map_pages(
+        self,
+        fn: Callable[[PageBackend], Any],
+        indices: Optional[Iterable[int]] = None,
+    ) -> List[Any]:
+        """Run a function on each page and collect the results.
+
+        Pages are processed one after another: MuPDF is not thread-safe, so
+        a thread pool over a shared document would crash, and separate
+        documents per worker would each reparse the file.
+
+        Args:
+            fn: Called with each page backend
+            indices: Page indices to visit, defaults to every page
+
+        Returns:
+            Results of fn, in the order of indices
+        """
+        if indices is None:
+            indices = range(self.page_count)
+        get_page = self.get_page
+        return [fn(get_page(index)) for index in indices]
+
     @abstractmethod
     def get_outlines(self) -> List[OutlineItem]:
         """Get document outline/TOC."""
@@ -314,8 +479,13 @@ class DocumentBackend(ABC):
         ...
 
     @abstractmethod
-    def save(self, path: Optional[Union[str, Path]] = None) -> None:
-        """Save the document."""
+    def save(self, path: Optional[Union[str, Path]] = None, optimize: bool = False) -> None:
+        """Save the document.
+
+        Args:
+            path: Target path; defaults to the file the document was opened from
+            optimize: Compact the file (drop unused objects, compress streams)
+        """
         ...
 
     @abstractmethod
@@ -4,17 +4,26 @@ PyMuPDF backend implementation.
 
 from __future__ import annotations
 
+import functools
 import io
+import operator
+import os
 import re
 import tempfile
+import threading
+import unicodedata
 import warnings
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 warnings.filterwarnings("ignore", message="builtin type Swig")
 
 import pymupdf
 
+from ..colors import BYTE_HEX, rgb_to_hex  # noqa: E402
 from ..types import (  # noqa: E402
     AnnotationInfo,
     CharInfo,
@@ -38,7 +47,9 @@ from ..types import (
 from .base import DocumentBackend, PageBackend  # noqa: E402
 
 
-def _convert_font_to_ttf(font_data: bytes, font_ext: str, output_path: str) -> bool:
+def _convert_font_to_ttf(
+    font_data: bytes, font_ext: str, output_path: Union[str, BinaryIO]
+) -> bool:
     """Convert font data to TTF format.
 
     Flet/Flutter works best with TTF fonts. This function converts various
@@ -47,7 +58,8 @@ def _convert_font_to_ttf(font_data: bytes, font_ext: str, output_path: str) -> b
     Args:
         font_data: Raw font bytes
         font_ext: Original extension ('cff', 'otf', 'ttf', 'ttc', 'pfa', 'pfb')
-        output_path: Path to save the TTF file
+        output_path: Path to save the TTF file, or a binary file object
+            (e.g. io.BytesIO) to keep the result in memory
 
     Returns:
         True if conversion succeeded, False otherwise
@@ -147,9 +159,13 @@ def _convert_font_to_ttf(font_data: bytes, font_ext: str, output_path: str) -> b
             font_data_fixed = font_data + cleartomark_padding
 
             # Write to temp file (T1Font requires file path)
-            temp_pfa = output_path + ".tmp.pfa"
-            with open(temp_pfa, "wb") as f:
-                f.write(font_data_fixed)
+            if isinstance(output_path, str):
+                temp_pfa = output_path + ".tmp.pfa"
+                with open(temp_pfa, "wb") as f:
+                    f.write(font_data_fixed)
+            else:
+                # No output path to put it next to; mkstemp creates it safely
+                temp_pfa = _write_temp_file(font_data_fixed, ".tmp.pfa")
 
             try:
                 t1 = T1Font(temp_pfa)
@@ -301,8 +317,11 @@ def _convert_font_to_ttf(font_data: bytes, font_ext: str, output_path: str) -> b
 
         elif font_ext in ("ttf", "ttc"):
             # Already TTF - just write it
-            with open(output_path, "wb") as f:
-                f.write(font_data)
+            if isinstance(output_path, str):
+                with open(output_path, "wb") as f:
+                    f.write(font_data)
+            else:
+                output_path.write(font_data)
             return True
 
         return False
@@ -310,28 +329,312 @@ def _convert_font_to_ttf(font_data: bytes, font_ext: str, output_path: str) -> b
         return False
 
 
+# Precompiled patterns for content stream parsing
+_RE_RESOURCES_REF = re.compile(r"/Resources\s+(\d+)\s+0\s+R")
+_RE_COLORSPACE_REF = re.compile(r"/ColorSpace\s+(\d+)\s+0\s+R")
+# Content stream operators, matched on the raw stream bytes
+_RE_CS = re.compile(rb"/(\w+)\s+cs")
+_RE_SCN = re.compile(rb"/(\w+)\s+scn")
+_RE_STRING_LITERAL = re.compile(rb"\(([^)]*)\)")
+# Rectangle fill: x y w h re f
+_RE_RECT_FILL = re.compile(rb"([\d.]+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s+re\s*\n?f")
+# Dash array like "[ 1.5 1.5 ] 0"
+_RE_DASH = re.compile(r"\[\s*([\d.\s]+)\s*\]")
+
+# PDF lexical classes (ISO 32000-1, 7.2.2)
+_PDF_WHITESPACE = " \t\r\n\f\0"
+_PDF_DELIMITERS = frozenset("()<>[]{}/%" + _PDF_WHITESPACE)
+# "#xx" escape inside a name (7.3.5)
+_RE_PDF_NAME_ESCAPE = re.compile(r"#([0-9A-Fa-f]{2})")
+
+
+def _pdf_skip_ws(s: str, i: int, n: int) -> int:
+    """Return the index of the next non-whitespace, non-comment character."""
+    while i < n:
+        c = s[i]
+        if c in _PDF_WHITESPACE:
+            i += 1
+        elif c == "%":
+            eol = s.find("\n", i)
+            i = n if eol < 0 else eol + 1
+        else:
+            break
+    return i
+
+
+def _pdf_token_end(s: str, i: int, n: int) -> int:
+    """Return the index just past the regular token starting at i."""
+    while i < n and s[i] not in _PDF_DELIMITERS:
+        i += 1
+    return i
+
+
+def _pdf_name(s: str, i: int, n: int) -> Tuple[str, int]:
+    """Return the name starting just past a slash at i, with escapes decoded."""
+    end = _pdf_token_end(s, i, n)
+    name = s[i:end]
+    if "#" in name:
+        name = _RE_PDF_NAME_ESCAPE.sub(lambda m: chr(int(m.group(1), 16)), name)
+    return name, end
+
+
+def _pdf_ref_end(s: str, i: int, n: int) -> int:
+    """Return the index past a trailing "G R" of an indirect reference, or 0."""
+    j = _pdf_skip_ws(s, i, n)
+    k = _pdf_token_end(s, j, n)
+    if k == j or not s[j:k].isdigit():
+        return 0
+    m = _pdf_skip_ws(s, k, n)
+    if m < n and s[m] == "R" and _pdf_token_end(s, m, n) == m + 1:
+        return m + 1
+    return 0
+
+
+def _pdf_value(s: str, i: int, n: int) -> Tuple[object, int]:
+    """Parse one PDF value starting at i.
+
+    Returns:
+        (value, index after the value). Names come back without the slash,
+        indirect references as their object number, strings as None.
+    """
+    i = _pdf_skip_ws(s, i, n)
+    if i >= n:
+        return None, n
+    c = s[i]
+
+    if c == "/":
+        return _pdf_name(s, i + 1, n)
+
+    if c == "<":
+        if s.startswith("<<", i):
+            result = {}
+            i += 2
+            while True:
+                i = _pdf_skip_ws(s, i, n)
+                if i >= n:
+                    return result, n
+                if s.startswith(">>", i):
+                    return result, i + 2
+                if s[i] != "/":
+                    # Malformed entry, skip it
+                    _, i = _pdf_value(s, i, n)
+                    continue
+                key, i = _pdf_name(s, i + 1, n)
+                i = _pdf_skip_ws(s, i, n)
+                if s.startswith(">>", i):
+                    # Key without a value; keep the ">>" for this dict
+                    result[key] = None
+                    continue
+                result[key], i = _pdf_value(s, i, n)
+        # Hex string
+        end = s.find(">", i)
+        return None, n if end < 0 else end + 1
+
+    if c == "[":
+        items = []
+        i += 1
+        while True:
+            i = _pdf_skip_ws(s, i, n)
+            if i >= n:
+                return items, n
+            if s[i] == "]":
+                return items, i + 1
+            value, i = _pdf_value(s, i, n)
+            items.append(value)
+
+    if c == "(":
+        # Literal string with balanced parentheses and backslash escapes
+        depth = 0
+        while i < n:
+            c = s[i]
+            if c == "\\":
+                i += 2
+                continue
+            if c == "(":
+                depth += 1
+            elif c == ")":
+                depth -= 1
+                if depth == 0:
+                    return None, i + 1
+            i += 1
+        return None, n
+
+    end = _pdf_token_end(s, i, n)
+    if end == i:
+        # Stray delimiter such as ">" or "}"
+        return None, i + 1
+    token = s[i:end]
+    if token == "true":
+        return True, end
+    if token == "false":
+        return False, end
+    try:
+        number = int(token)
+    except ValueError:
+        try:
+            return float(token), end
+        except ValueError:
+            return None, end
+    ref_end = _pdf_ref_end(s, end, n)
+    return number, ref_end or end
+
+
+def _parse_pdf_dict(obj_str: str) -> Dict[str, object]:
+    """Parse the dictionary of a PDF object source string in a single pass.
+
+    Covers the syntax xref_object() emits for pattern, shading, function and
+    resource objects: names, numbers, booleans, indirect references, arrays
+    and nested dictionaries. Strings are skipped.
+
+    Args:
+        obj_str: Object source as returned by Document.xref_object()
+
+    Returns:
+        Dict mapping key names (without the slash) to values. Indirect
+        references are returned as their object number.
+    """
+    start = obj_str.find("<<")
+    if start < 0:
+        return {}
+    value, _ = _pdf_value(obj_str, start, len(obj_str))
+    return value if isinstance(value, dict) else {}
+
+
+def _pdf_rgb(value) -> Optional[Color]:
+    """Convert a parsed C0/C1 array to an RGB tuple, or None if not RGB."""
+    if isinstance(value, list) and len(value) >= 3:
+        return (float(value[0]), float(value[1]), float(value[2]))
+    return None
+
+
+# Soft mask construct kinds used by _detect_soft_mask_compositing
+_MASK_NONE = 0
+_MASK_WHITE_RECT = 1
+_MASK_BLACK_RECT = 2
+_MASK_BLACK_PATH = 3
+
+# Map PyMuPDF link kinds to LinkInfo
+# LINK_NONE=0, LINK_GOTO=1, LINK_URI=2, LINK_LAUNCH=3, LINK_NAMED=4, LINK_GOTOR=5
+
+
+def _goto_link(link: dict, rect: Rect) -> LinkInfo:
+    """Internal link to a page."""
+    return LinkInfo(rect=rect, kind="goto", page=link.get("page", 0))
+
+
+def _uri_link(link: dict, rect: Rect) -> LinkInfo:
+    """External URL."""
+    return LinkInfo(rect=rect, kind="uri", uri=link.get("uri", ""))
+
+
+def _named_link(link: dict, rect: Rect) -> LinkInfo:
+    """Named destination."""
+    return LinkInfo(rect=rect, kind="named", name=link.get("name", ""))
+
+
+def _launch_link(link: dict, rect: Rect) -> LinkInfo:
+    """Launch external file/app."""
+    return LinkInfo(rect=rect, kind="launch", file=link.get("file", ""))
+
+
+def _gotor_link(link: dict, rect: Rect) -> LinkInfo:
+    """Link to another PDF file, treated as goto for simplicity."""
+    return LinkInfo(
+        rect=rect, kind="goto", page=link.get("page", 0), file=link.get("file", "")
+    )
+
+
+_LINK_BUILDERS = {
+    pymupdf.LINK_GOTO: _goto_link,
+    pymupdf.LINK_URI: _uri_link,
+    pymupdf.LINK_NAMED: _named_link,
+    pymupdf.LINK_LAUNCH: _launch_link,
+    pymupdf.LINK_GOTOR: _gotor_link,
+}
+
+# Annotation color when none is set (yellow, same as AnnotationInfo's default)
+_DEFAULT_ANNOT_COLOR: Color = (1.0, 1.0, 0.0)
+
+# Annotation types that store points (QuadPoints, InkList, Vertices or L);
+# for every other type annot.vertices is a wasted lookup returning None
+_VERTEX_ANNOT_TYPES = frozenset(
+    (
+        pymupdf.PDF_ANNOT_LINE,
+        pymupdf.PDF_ANNOT_POLYGON,
+        pymupdf.PDF_ANNOT_POLY_LINE,
+        pymupdf.PDF_ANNOT_HIGHLIGHT,
+        pymupdf.PDF_ANNOT_UNDERLINE,
+        pymupdf.PDF_ANNOT_SQUIGGLY,
+        pymupdf.PDF_ANNOT_STRIKE_OUT,
+        pymupdf.PDF_ANNOT_REDACT,
+        pymupdf.PDF_ANNOT_INK,
+    )
+)
+
+# Bounding box for links that have no "from" rect
+_EMPTY_RECT: Rect = (0.0, 0.0, 0.0, 0.0)
+
+# Rect/Quad -> plain tuples in one C-level call instead of four attribute lookups
+_rect_tuple = operator.attrgetter("x0", "y0", "x1", "y1")
+_quad_corners = operator.attrgetter("ul.x", "ul.y", "lr.x", "lr.y")
+
+# LineEndStyle -> PyMuPDF line end constant
+_LINE_END_MAP: Dict[LineEndStyle, int] = {
+    LineEndStyle.NONE: pymupdf.PDF_ANNOT_LE_NONE,
+    LineEndStyle.SQUARE: pymupdf.PDF_ANNOT_LE_SQUARE,
+    LineEndStyle.CIRCLE: pymupdf.PDF_ANNOT_LE_CIRCLE,
+    LineEndStyle.DIAMOND: pymupdf.PDF_ANNOT_LE_DIAMOND,
+    LineEndStyle.OPEN_ARROW: pymupdf.PDF_ANNOT_LE_OPEN_ARROW,
+    LineEndStyle.CLOSED_ARROW: pymupdf.PDF_ANNOT_LE_CLOSED_ARROW,
+    LineEndStyle.BUTT: pymupdf.PDF_ANNOT_LE_BUTT,
+    LineEndStyle.R_OPEN_ARROW: pymupdf.PDF_ANNOT_LE_R_OPEN_ARROW,
+    LineEndStyle.R_CLOSED_ARROW: pymupdf.PDF_ANNOT_LE_R_CLOSED_ARROW,
+    LineEndStyle.SLASH: pymupdf.PDF_ANNOT_LE_SLASH,
+}
+
+
+def _srgb_to_hex(color: int) -> str:
+    """Convert a packed sRGB integer (text span color) to hex string."""
+    return (
+        "#"
+        + BYTE_HEX[(color >> 16) & 0xFF]
+        + BYTE_HEX[(color >> 8) & 0xFF]
+        + BYTE_HEX[color & 0xFF]
+    )
+
+
 def _color_to_hex(color) -> str:
     """Convert PyMuPDF color to hex string."""
     if color is None:
         return "#000000"
+    if isinstance(color, list):
+        color = tuple(color)
+    return _color_to_hex_cached(color)
 
+
+@functools.lru_cache(maxsize=512)
+def _color_to_hex_cached(color) -> str:
+    """Convert a hashable PyMuPDF color to hex string.
+
+    Paths on a page tend to reuse a handful of stroke/fill colors, so most
+    calls are cache hits.
+    """
     if isinstance(color, (int, float)):
-        gray = int(color * 255)
-        return f"#{gray:02x}{gray:02x}{gray:02x}"
+        gray = BYTE_HEX[int(color * 255)]
+        return "#" + gray + gray + gray
 
-    if isinstance(color, (list, tuple)):
+    if isinstance(color, tuple):
         if len(color) == 1:
-            gray = int(color[0] * 255)
-            return f"#{gray:02x}{gray:02x}{gray:02x}"
+            gray = BYTE_HEX[int(color[0] * 255)]
+            return "#" + gray + gray + gray
         elif len(color) == 3:
-            r, g, b = [int(c * 255) for c in color]
-            return f"#{r:02x}{g:02x}{b:02x}"
+            return rgb_to_hex(color)
         elif len(color) == 4:
             c, m, y, k = color
             r = int(255 * (1 - c) * (1 - k))
             g = int(255 * (1 - m) * (1 - k))
             b = int(255 * (1 - y) * (1 - k))
-            return f"#{r:02x}{g:02x}{b:02x}"
+            return "#" + BYTE_HEX[r] + BYTE_HEX[g] + BYTE_HEX[b]
 
     return "#000000"
 
@@ -358,9 +661,189 @@ def _get_font_family(pdf_font: str, flags: int = 0) -> str:
     return clean_name
 
 
+def _write_temp_file(data: bytes, suffix: str) -> str:
+    """Write data to a new temporary file with raw os.write calls.
+
+    Args:
+        data: File contents
+        suffix: File name suffix, e.g. ".png"
+
+    Returns:
+        Path of the written file
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    return path
+
+
+# Below this many bytes in total, temp files are written one after another:
+# handing a few small PNGs to worker threads costs more than the writes
+_PARALLEL_WRITE_MIN_BYTES = 1 << 20
+
+# Thread pool for temp file writes, shared by all documents. Created on first
+# use and shut down by _shutdown_io_pool(); the lock keeps submissions and
+# shutdown apart, so work is never submitted to a pool being shut down.
+_io_pool: Optional[ThreadPoolExecutor] = None
+_io_pool_lock = threading.Lock()
+
+
+def _shutdown_io_pool() -> None:
+    """Shut down the shared temp file pool; the next write creates a new one."""
+    global _io_pool
+    with _io_pool_lock:
+        pool, _io_pool = _io_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _write_temp_file_or_none(item: Tuple[bytes, str]) -> Optional[str]:
+    """_write_temp_file for a (data, suffix) pair, None if writing failed."""
+    try:
+        return _write_temp_file(*item)
+    except OSError:
+        return None
+
+
+def _write_temp_files(items: List[Tuple[bytes, str]]) -> List[Optional[str]]:
+    """Write several temporary files, concurrently when there is enough data.
+
+    Only plain file I/O happens here (os.write releases the GIL), so this is
+    safe to run off the thread that owns the PyMuPDF document.
+
+    Args:
+        items: (data, suffix) pairs, see _write_temp_file
+
+    Returns:
+        File paths in the order of items; None where writing failed
+    """
+    if len(items) < 2 or sum(len(data) for data, _ in items) < _PARALLEL_WRITE_MIN_BYTES:
+        return [_write_temp_file_or_none(item) for item in items]
+
+    global _io_pool
+    with _io_pool_lock:
+        if _io_pool is None:
+            _io_pool = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="pdf-temp-files",
+            )
+        futures = [_io_pool.submit(_write_temp_file_or_none, item) for item in items]
+    return [future.result() for future in futures]
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_dashes(dashes: str) -> Optional[Tuple[float, ...]]:
+    """Parse a PyMuPDF dash string like "[ 1.5 1.5 ] 0" into its dash array.
+
+    Dashed pages repeat the same few patterns across many drawings, so the
+    parsed floats are cached per string.
+    """
+    dash_match = _RE_DASH.search(dashes)
+    if not dash_match:
+        return None
+    return tuple(float(x) for x in dash_match.group(1).split())
+
+
+@functools.lru_cache(maxsize=256)
+def _font_style(font: str, flags: int) -> Tuple[bool, bool]:
+    """Get (bold, italic) for a span from its font name and PyMuPDF flags.
+
+    A page only uses a handful of fonts, so after the first line of each
+    font this is a cache hit instead of several string scans.
+    """
+    font_lower = font.lower()
+    bold = bool(flags & 16) or "bold" in font_lower
+    italic = bool(flags & 2) or "italic" in font_lower or "oblique" in font_lower
+    return bold, italic
+
+
+def _is_type3_font(font: str) -> bool:
+    """Check whether a span font name looks like a Type3 font."""
+    return "T3" in font or font.startswith("Unnamed")
+
+
+def _is_word_char(c: str) -> bool:
+    """Whether c is a word character, like regex \\w."""
+    return c.isalnum() or c == "_"
+
+
+def _extend_span_chars(chars_extend: Callable, span: dict) -> None:
+    """Emit the CharInfo entries of one text dict span.
+
+    Args:
+        chars_extend: extend method of the output list
+        span: Span from get_text("dict"), with or without per-char data
+    """
+    span_get = span.get
+    font = span_get("font", "Helvetica")
+    size = span_get("size", 12)
+    color = span_get("color", 0)
+    hex_color = _srgb_to_hex(color) if isinstance(color, int) else "#000000"
+    # Positional construction skips keyword matching in the hot loops:
+    # CharInfo(char, x, y, width, height, font_name, font_size, color)
+    make_char = CharInfo
+
+    span_chars = span_get("chars", [])
+    if span_chars:
+        # One extend per span instead of an append per char;
+        # the single-item inner loop just unpacks the bbox
+        chars_extend(
+            make_char(c, x0, y0, x1 - x0, y1 - y0, font, size, hex_color)
+            for char_info in span_chars
+            if (c := char_info.get("c"))
+            for x0, y0, x1, y1 in (char_info.get("bbox", (0, 0, 0, 0)),)
+        )
+    else:
+        text = span_get("text", "")
+        if text.strip():
+            x0, y0, x1, y1 = span_get("bbox", (0, 0, 0, 0))
+            char_width = (x1 - x0) / max(len(text), 1)
+            height = y1 - y0
+            # Only x varies per char; derive it from the index
+            # instead of accumulating to avoid float drift
+            chars_extend(
+                make_char(c, x0 + i * char_width, y0, char_width, height, font, size, hex_color)
+                for i, c in enumerate(text)
+            )
+
+
 class PyMuPDFPage(PageBackend):
     """PyMuPDF page implementation."""
 
+    # Up to page_cache_size pages live at once, each with a dozen caches;
+    # slots drop the per-instance __dict__
+    __slots__ = (
+        "_doc",
+        "_index",
+        "_shadings",
+        "_text_gradient",
+        "_cached_has_patterns",
+        "_temp_image_files",
+        "_cached_text_blocks",
+        "_cached_chars",
+        "_cached_char_arrays",
+        "_cached_graphics",
+        "_cached_images",
+        "_cached_annotations",
+        "_cached_links",
+        "_cached_content",
+        "_cached_page_text",
+        "_cached_text_dict",
+        "_cached_drawings",
+        "_cached_textpage",
+        "_cached_search_lines",
+        "_last_search",
+        "_cached_has_type3",
+        "_cached_has_stroked",
+        "_cached_gradient_fills",
+        "_cached_skip_indices",
+        "_cached_color_overrides",
+    )
+
     def __init__(self, doc: "PyMuPDFBackend", index: int):
         self._doc = doc
         self._index = index
@@ -368,16 +851,37 @@ class PyMuPDFPage(PageBackend):
             None
         )
         self._text_gradient: Optional[Union[LinearGradient, RadialGradient]] = None
+        # Whether the page resources declare any /Pattern (gates gradient parsing)
+        self._cached_has_patterns: Optional[bool] = None
         # Track temp image files for cleanup
         self._temp_image_files: List[str] = []
 
         # Extraction cache - avoids re-parsing PDF on every render
         self._cached_text_blocks: Optional[List[TextBlock]] = None
         self._cached_chars: Optional[List[CharInfo]] = None
+        self._cached_char_arrays: Optional[Dict[str, Union[array, str]]] = None
         self._cached_graphics: Optional[List[GraphicsInfo]] = None
         self._cached_images: Optional[List[ImageInfo]] = None
         self._cached_annotations: Optional[List[AnnotationInfo]] = None
         self._cached_links: Optional[List[LinkInfo]] = None
+        self._cached_content: Optional[bytes] = None
+        self._cached_page_text: Optional[str] = None
+        # Raw PyMuPDF extraction results shared by the extractors above
+        self._cached_text_dict: Optional[dict] = None
+        self._cached_drawings: Optional[list] = None
+        # (page, TextPage) shared by get_text() and search_text(); the page is
+        # kept because a TextPage only holds a weak reference to it
+        self._cached_textpage: Optional[Tuple[pymupdf.Page, pymupdf.TextPage]] = None
+        # Char index over that TextPage for checking search hits
+        self._cached_search_lines: Optional[Tuple[List[float], List[Tuple[array, str]]]] = None
+        # Last search_text call: ((query, case_sensitive, whole_word, need_quads), results)
+        self._last_search: Optional[Tuple[Tuple[str, bool, bool, bool], List[SearchResult]]] = None
+        # Page-wide heuristics shared by text and graphics extraction
+        self._cached_has_type3: Optional[bool] = None
+        self._cached_has_stroked: Optional[bool] = None
+        self._cached_gradient_fills: Optional[List[GraphicsInfo]] = None
+        self._cached_skip_indices: Optional[Set[int]] = None
+        self._cached_color_overrides: Optional[Dict[int, str]] = None
 
     @property
     def _page(self) -> pymupdf.Page:
@@ -388,13 +892,97 @@ class PyMuPDFPage(PageBackend):
         """Invalidate all extraction caches. Call after modifying page content."""
         self._cached_text_blocks = None
         self._cached_chars = None
+        self._cached_char_arrays = None
         self._cached_graphics = None
         self._cached_images = None
         self._cached_annotations = None
         self._cached_links = None
+        self._cached_content = None
+        self._cached_page_text = None
+        self._cached_text_dict = None
+        self._cached_drawings = None
+        self._cached_textpage = None
+        self._cached_search_lines = None
+        self._last_search = None
+        self._cached_has_type3 = None
+        self._cached_has_stroked = None
+        self._cached_gradient_fills = None
+        self._cached_skip_indices = None
+        self._cached_color_overrides = None
         # Also reset gradient detection since it may have changed
         self._shadings = None
         self._text_gradient = None
+        self._cached_has_patterns = None
+
+    def _invalidate_annotation_cache(self) -> None:
+        """Drop caches affected by adding annotations.
+
+        Annotations don't show up in get_text(), so text-derived caches are
+        kept.
+        """
+        self._cached_annotations = None
+
+    def _get_content(self) -> bytes:
+        """Get the raw page content stream (cached).
+
+        Content stream operators are ASCII, so callers search the bytes
+        directly and only decode the pieces they capture (as latin-1, which
+        maps every byte to one character).
+        """
+        if self._cached_content is None:
+            self._cached_content = self._page.read_contents() or b""
+        return self._cached_content
+
+    def _get_text_dict(self) -> dict:
+        """Get the page's get_text("dict") result (cached).
+
+        This is the most expensive per-page extraction, and text blocks,
+        chars and the Type3 font check all read it.
+        """
+        if self._cached_text_dict is None:
+            self._cached_text_dict = self._page.get_text(
+                "dict", flags=pymupdf.TEXT_PRESERVE_WHITESPACE
+            )
+        return self._cached_text_dict
+
+    def _get_textpage(self) -> Tuple[pymupdf.Page, pymupdf.TextPage]:
+        """Get the page and a TextPage built with search flags (cached).
+
+        Every get_text()/search_for() call without a textpage re-runs text
+        extraction for the whole page. Sharing one keeps repeated searches
+        cheap and makes search hits line up with get_text() output.
+        Image blocks are left out, so image streams are never decoded.
+        """
+        if self._cached_textpage is None:
+            page = self._page
+            textpage = page.get_textpage(flags=pymupdf.TEXTFLAGS_SEARCH)
+            self._cached_textpage = (page, textpage)
+        return self._cached_textpage
+
+    def _get_drawings(self) -> list:
+        """Get the page's get_drawings() result (cached)."""
+        if self._cached_drawings is None:
+            self._cached_drawings = self._page.get_drawings()
+        return self._cached_drawings
+
+    def _has_pattern_resources(self) -> bool:
+        """Check whether the page resources contain a /Pattern entry (cached).
+
+        Gradients are always drawn through a pattern, so pages without one
+        skip gradient detection without reading the content stream.
+        """
+        if self._cached_has_patterns is None:
+            has_patterns = False
+            try:
+                # Key paths resolve the Resources reference inside MuPDF
+                kind, _ = self._doc._doc.xref_get_key(
+                    self._page.xref, "Resources/Pattern"
+                )
+                has_patterns = kind in ("xref", "dict")
+            except Exception:
+                pass
+            self._cached_has_patterns = has_patterns
+        return self._cached_has_patterns
 
     def _extract_shadings(self) -> Dict[str, Union[LinearGradient, RadialGradient]]:
         """Extract shading/gradient definitions from page resources."""
@@ -402,78 +990,36 @@ class PyMuPDFPage(PageBackend):
             return self._shadings
 
         self._shadings = {}
+        if not self._has_pattern_resources():
+            return self._shadings
         doc = self._doc._doc
 
         try:
-            # Get page object to find pattern resources
-            page_xref = self._page.xref
-            page_obj = doc.xref_object(page_xref)
-
-            # Find all xref references in the page object
-            all_refs = re.findall(r"/(\w+)\s+(\d+)\s+0\s+R", page_obj)
-
-            # First, find and follow the Resources reference
-            resources_obj = page_obj
-            for name, xref_str in all_refs:
-                if name == "Resources":
-                    resources_xref = int(xref_str)
-                    resources_obj = doc.xref_object(resources_xref)
-                    break
-
-            # Find Pattern dictionary in resources
-            pattern_dict_xref = None
-            resource_refs = re.findall(r"/(\w+)\s+(\d+)\s+0\s+R", resources_obj)
-            for name, xref_str in resource_refs:
-                if name == "Pattern":
-                    pattern_dict_xref = int(xref_str)
-                    break
-
-            # Also check for inline Pattern dictionary: /Pattern << /P1 5 0 R >>
-            if not pattern_dict_xref:
-                inline_pattern = re.search(
-                    r"/Pattern\s*<<([^>]+)>>", resources_obj, re.DOTALL
-                )
-                if inline_pattern:
-                    pattern_content = inline_pattern.group(1)
-                    pattern_refs = re.findall(r"/(\w+)\s+(\d+)\s+0\s+R", pattern_content)
-                    for pattern_name, xref_str in pattern_refs:
-                        xref = int(xref_str)
-                        try:
-                            obj = doc.xref_object(xref)
-                            if "/PatternType 2" in obj:
-                                shading_match = re.search(
-                                    r"/Shading\s+(\d+)\s+0\s+R", obj
-                                )
-                                if shading_match:
-                                    shading_xref = int(shading_match.group(1))
-                                    gradient = self._parse_shading(doc, shading_xref)
-                                    if gradient:
-                                        self._shadings[pattern_name] = gradient
-                        except Exception:
-                            continue
+            # Only the Pattern dictionary is needed, referenced or inline
+            # (/Pattern << /P1 5 0 R >>). Fetching it by key path skips
+            # parsing the page and Resources objects around it.
+            kind, value = doc.xref_get_key(self._page.xref, "Resources/Pattern")
+            if kind == "xref":
+                patterns = _parse_pdf_dict(doc.xref_object(int(value.split()[0])))
+            elif kind == "dict":
+                patterns = _parse_pdf_dict(value)
+            else:
+                return self._shadings
 
-            # If we have a Pattern dictionary reference, look inside it for patterns
-            if pattern_dict_xref:
+            for pattern_name, xref in patterns.items():
+                if not isinstance(xref, int):
+                    continue
                 try:
-                    pattern_dict = doc.xref_object(pattern_dict_xref)
-                    pattern_refs = re.findall(r"/(\w+)\s+(\d+)\s+0\s+R", pattern_dict)
-                    for pattern_name, xref_str in pattern_refs:
-                        xref = int(xref_str)
-                        try:
-                            obj = doc.xref_object(xref)
-                            if "/PatternType 2" in obj:
-                                shading_match = re.search(
-                                    r"/Shading\s+(\d+)\s+0\s+R", obj
-                                )
-                                if shading_match:
-                                    shading_xref = int(shading_match.group(1))
-                                    gradient = self._parse_shading(doc, shading_xref)
-                                    if gradient:
-                                        self._shadings[pattern_name] = gradient
-                        except Exception:
-                            continue
+                    pattern = _parse_pdf_dict(doc.xref_object(xref))
+                    shading_xref = pattern.get("Shading")
+                    if pattern.get("PatternType") == 2 and isinstance(
+                        shading_xref, int
+                    ):
+                        gradient = self._parse_shading(doc, shading_xref)
+                        if gradient:
+                            self._shadings[pattern_name] = gradient
                 except Exception:
-                    pass
+                    continue
 
         except Exception:
             pass
@@ -485,35 +1031,31 @@ class PyMuPDFPage(PageBackend):
     ) -> Optional[Union[LinearGradient, RadialGradient]]:
         """Parse a shading object into a gradient definition."""
         try:
-            obj = doc.xref_object(xref)
+            shading = _parse_pdf_dict(doc.xref_object(xref))
 
             # Get shading type
-            type_match = re.search(r"/ShadingType\s+(\d+)", obj)
-            if not type_match:
+            shading_type = shading.get("ShadingType")
+            if not isinstance(shading_type, int):
                 return None
 
-            shading_type = int(type_match.group(1))
-
-            # Get function reference for colors
-            func_match = re.search(r"/Function\s+(\d+)\s+0\s+R", obj)
-            if not func_match:
+            # Get function for colors, referenced or inline
+            func = shading.get("Function")
+            func_xref = None
+            if isinstance(func, int):
+                func_xref = func
+                func = _parse_pdf_dict(doc.xref_object(func_xref))
+            if not isinstance(func, dict):
                 return None
 
-            func_xref = int(func_match.group(1))
-            func_obj = doc.xref_object(func_xref)
-
             # Determine function type
-            func_type_match = re.search(r"/FunctionType\s+(\d+)", func_obj)
-            func_type = int(func_type_match.group(1)) if func_type_match else 2
+            func_type = func.get("FunctionType", 2)
 
             colors = []
 
             if func_type == 0:
                 # Sampled function - read sample data to extract colors
-                # Get number of samples and extract first/last colors
-                size_match = re.search(r"/Size\s+\[\s*(\d+)\s*\]", func_obj)
-                if size_match:
-                    num_samples = int(size_match.group(1))
+                # Extract first/last colors from the sample stream
+                if func_xref is not None and func.get("Size"):
                     try:
                         # Read the stream data (contains RGB samples)
                         stream_data = doc.xref_stream(func_xref)
@@ -536,86 +1078,63 @@ class PyMuPDFPage(PageBackend):
 
             elif func_type == 2:
                 # Exponential interpolation function with C0 and C1
-                c0_match = re.search(r"/C0\s+\[\s*([\d.\s-]+)\s*\]", func_obj)
-                c1_match = re.search(r"/C1\s+\[\s*([\d.\s-]+)\s*\]", func_obj)
-
-                if c0_match and c1_match:
-                    c0 = tuple(float(x) for x in c0_match.group(1).split())
-                    c1 = tuple(float(x) for x in c1_match.group(1).split())
-                    if len(c0) >= 3 and len(c1) >= 3:
-                        colors = [c0[:3], c1[:3]]
+                c0 = _pdf_rgb(func.get("C0"))
+                c1 = _pdf_rgb(func.get("C1"))
+                if c0 and c1:
+                    colors = [c0, c1]
 
             elif func_type == 3:
                 # Stitching function - get colors from subfunctions
-                # Find the Functions array
-                funcs_match = re.search(r"/Functions\s+\[([\s\d]+0\s+R)+\]", func_obj)
-                if funcs_match:
-                    sub_refs = re.findall(r"(\d+)\s+0\s+R", funcs_match.group(0))
-                    for sub_xref_str in sub_refs:
-                        sub_xref = int(sub_xref_str)
-                        try:
-                            sub_obj = doc.xref_object(sub_xref)
-                            c0_match = re.search(
-                                r"/C0\s+\[\s*([\d.\s-]+)\s*\]", sub_obj
-                            )
-                            c1_match = re.search(
-                                r"/C1\s+\[\s*([\d.\s-]+)\s*\]", sub_obj
-                            )
-                            if c0_match:
-                                c0 = tuple(
-                                    float(x) for x in c0_match.group(1).split()
-                                )
-                                if len(c0) >= 3:
-                                    if not colors:
-                                        colors.append(c0[:3])
-                            if c1_match:
-                                c1 = tuple(
-                                    float(x) for x in c1_match.group(1).split()
-                                )
-                                if len(c1) >= 3:
-                                    colors.append(c1[:3])
-                        except Exception:
-                            continue
+                for sub_xref in func.get("Functions") or ():
+                    if not isinstance(sub_xref, int):
+                        continue
+                    try:
+                        sub_func = _parse_pdf_dict(doc.xref_object(sub_xref))
+                        c0 = _pdf_rgb(sub_func.get("C0"))
+                        if c0 and not colors:
+                            colors.append(c0)
+                        c1 = _pdf_rgb(sub_func.get("C1"))
+                        if c1:
+                            colors.append(c1)
+                    except Exception:
+                        continue
 
             if not colors or len(colors) < 2:
                 return None
 
+            coords = shading.get("Coords")
+            if not isinstance(coords, list):
+                return None
+            coords = [float(c) for c in coords]
+
             if shading_type == 2:  # Axial (linear) gradient
-                coords_match = re.search(r"/Coords\s+\[\s*([\d.\s-]+)\s*\]", obj)
-                if coords_match:
-                    coords = [float(x) for x in coords_match.group(1).split()]
-                    if len(coords) >= 4:
-                        # Parse Extend property [extend_start extend_end]
-                        extend_start, extend_end = True, True
-                        extend_match = re.search(
-                            r"/Extend\s+\[\s*(\w+)\s+(\w+)\s*\]", obj
-                        )
-                        if extend_match:
-                            extend_start = extend_match.group(1).lower() == "true"
-                            extend_end = extend_match.group(2).lower() == "true"
-
-                        return LinearGradient(
-                            x0=coords[0],
-                            y0=coords[1],
-                            x1=coords[2],
-                            y1=coords[3],
-                            colors=colors,
-                            extend_start=extend_start,
-                            extend_end=extend_end,
-                        )
+                if len(coords) >= 4:
+                    # Parse Extend property [extend_start extend_end]
+                    extend_start, extend_end = True, True
+                    extend = shading.get("Extend")
+                    if isinstance(extend, list) and len(extend) >= 2:
+                        extend_start = extend[0] is True
+                        extend_end = extend[1] is True
+
+                    return LinearGradient(
+                        x0=coords[0],
+                        y0=coords[1],
+                        x1=coords[2],
+                        y1=coords[3],
+                        colors=colors,
+                        extend_start=extend_start,
+                        extend_end=extend_end,
+                    )
 
             elif shading_type == 3:  # Radial gradient
-                coords_match = re.search(r"/Coords\s+\[\s*([\d.\s-]+)\s*\]", obj)
-                if coords_match:
-                    coords = [float(x) for x in coords_match.group(1).split()]
-                    # Radial: [x0, y0, r0, x1, y1, r1]
-                    if len(coords) >= 6:
-                        return RadialGradient(
-                            cx=coords[3],  # Use end circle center
-                            cy=coords[4],
-                            r=coords[5],
-                            colors=colors,
-                        )
+                # Radial: [x0, y0, r0, x1, y1, r1]
+                if len(coords) >= 6:
+                    return RadialGradient(
+                        cx=coords[3],  # Use end circle center
+                        cy=coords[4],
+                        r=coords[5],
+                        colors=colors,
+                    )
 
         except Exception:
             pass
@@ -630,18 +1149,16 @@ class PyMuPDFPage(PageBackend):
         color_map = {}
 
         try:
-            contents = self._page.read_contents()
-            if not contents:
+            content = self._get_content()
+            if not content:
                 return color_map
 
-            content_str = contents.decode("latin-1", errors="replace")
-
             # Track current fill state: 'pattern' or 'solid'
             current_fill = "solid"
 
             # Split into tokens/operations
             # Look for color operations and text operations
-            lines = content_str.replace("\r", "\n").split("\n")
+            lines = content.replace(b"\r", b"\n").split(b"\n")
 
             in_text_block = False
             for line in lines:
@@ -650,30 +1167,28 @@ class PyMuPDFPage(PageBackend):
                     continue
 
                 # Pattern colorspace + pattern: indicates gradient
-                if "cs" in line and "scn" in line:
+                if b"cs" in line and b"scn" in line:
                     current_fill = "pattern"
-                elif " scn" in line or line.endswith(" scn"):
+                elif b" scn" in line or line.endswith(b" scn"):
                     # Setting a pattern
                     current_fill = "pattern"
-                elif " rg" in line or line.endswith(" rg"):
+                elif b" rg" in line or line.endswith(b" rg"):
                     # Setting solid RGB color
                     current_fill = "solid"
-                elif " g" in line and "rg" not in line:
+                elif b" g" in line and b"rg" not in line:
                     # Setting solid gray
                     current_fill = "solid"
-                elif "BT" in line:
+                elif b"BT" in line:
                     in_text_block = True
-                elif "ET" in line:
+                elif b"ET" in line:
                     in_text_block = False
-                elif in_text_block and ("Tj" in line or "TJ" in line):
+                elif in_text_block and (b"Tj" in line or b"TJ" in line):
                     # Extract text from Tj or TJ operator
                     # Format: (text)Tj or [(text)]TJ
-                    import re as re_mod
-
-                    text_matches = re_mod.findall(r"\(([^)]*)\)", line)
+                    text_matches = _RE_STRING_LITERAL.findall(line)
                     for text in text_matches:
                         if text:
-                            color_map[text] = current_fill
+                            color_map[text.decode("latin-1")] = current_fill
 
         except Exception:
             pass
@@ -684,35 +1199,37 @@ class PyMuPDFPage(PageBackend):
         """Detect if text on this page uses a gradient fill."""
         if self._text_gradient is not None:
             return self._text_gradient
+        if not self._has_pattern_resources():
+            return None
 
         try:
             # Read the content stream
-            contents = self._page.read_contents()
-            if not contents:
+            content = self._get_content()
+            # A pattern fill needs an scn operator; most pages have none, and
+            # a substring scan is far cheaper than the regexes below
+            if b"scn" not in content:
                 return None
-
-            content_str = contents.decode("latin-1", errors="replace")
             doc = self._doc._doc
 
             # Check if Pattern colorspace is used
             uses_pattern_colorspace = False
 
             # Direct Pattern colorspace: /Pattern cs
-            if "/Pattern cs" in content_str or "/Pattern CS" in content_str:
+            if b"/Pattern cs" in content or b"/Pattern CS" in content:
                 uses_pattern_colorspace = True
 
             # Named colorspace that might be Pattern: /Rname cs
             # Need to check if the colorspace resolves to [ /Pattern ]
             if not uses_pattern_colorspace:
-                cs_match = re.search(r"/(\w+)\s+cs", content_str)
+                cs_match = _RE_CS.search(content)
                 if cs_match:
-                    cs_name = cs_match.group(1)
+                    cs_name = cs_match.group(1).decode("latin-1")
                     # Look up colorspace in page resources
                     page_xref = self._page.xref
                     page_obj = doc.xref_object(page_xref)
 
                     # Find Resources reference
-                    res_match = re.search(r"/Resources\s+(\d+)\s+0\s+R", page_obj)
+                    res_match = _RE_RESOURCES_REF.search(page_obj)
                     if res_match:
                         res_xref = int(res_match.group(1))
                         res_obj = doc.xref_object(res_xref)
@@ -721,9 +1238,7 @@ class PyMuPDFPage(PageBackend):
                         res_obj = page_obj
 
                     # Find ColorSpace dictionary
-                    cs_dict_match = re.search(
-                        r"/ColorSpace\s+(\d+)\s+0\s+R", res_obj
-                    )
+                    cs_dict_match = _RE_COLORSPACE_REF.search(res_obj)
                     if cs_dict_match:
                         cs_dict_xref = int(cs_dict_match.group(1))
                         cs_dict = doc.xref_object(cs_dict_xref)
@@ -741,9 +1256,9 @@ class PyMuPDFPage(PageBackend):
 
             if uses_pattern_colorspace:
                 # Find which pattern is used for non-stroking color
-                pattern_match = re.search(r"/(\w+)\s+scn", content_str)
+                pattern_match = _RE_SCN.search(content)
                 if pattern_match:
-                    pattern_name = pattern_match.group(1)
+                    pattern_name = pattern_match.group(1).decode("latin-1")
                     shadings = self._extract_shadings()
                     if pattern_name in shadings:
                         self._text_gradient = shadings[pattern_name]
@@ -754,6 +1269,46 @@ class PyMuPDFPage(PageBackend):
 
         return None
 
+    def _has_type3_fonts(self) -> bool:
+        """Check whether any text span uses a Type3-style font (cached).
+
+        Stops at the first Type3 span; callers that skip Type3 text test
+        each span with _is_type3_font() in their own pass.
+        """
+        if self._cached_has_type3 is None:
+            # The page font list is short and doesn't need text extraction.
+            # Only scan spans if it has a Type3 font, or one whose name is
+            # missing or looks like one (spans then get an "Unnamed" name).
+            # get_fonts() entries: (xref, ext, type, basefont, name, encoding)
+            candidates = any(
+                font[2] == "Type3" or not font[3] or _is_type3_font(font[3])
+                for font in self._page.get_fonts()
+            )
+            self._cached_has_type3 = candidates and any(
+                _is_type3_font(span.get("font", ""))
+                for block in self._get_text_dict().get("blocks", [])
+                if block.get("type") == 0
+                for line in block.get("lines", [])
+                for span in line.get("spans", [])
+            )
+        return self._cached_has_type3
+
+    def _detect_stroked_drawings(self) -> bool:
+        """Check whether the page drawings include strokes (cached).
+
+        Symbolic Type3 fonts come with stroked drawings, while text outline
+        Type3 fonts are fill-only (glyph outlines).
+        """
+        if self._cached_has_stroked is not None:
+            return self._cached_has_stroked
+
+        drawings = self._get_drawings()
+        self._cached_has_stroked = any(
+            d.get("color") is not None and (d.get("width") or 0) > 0
+            for d in drawings[:100]  # Check first 100 for performance
+        )
+        return self._cached_has_stroked
+
     @property
     def width(self) -> float:
         return self._page.rect.width
@@ -774,14 +1329,63 @@ class PyMuPDFPage(PageBackend):
             rotation=self._page.rotation,
         )
 
+    def _iter_cached(self, attr: str, generate: Callable[[], Iterator]) -> Iterator:
+        """Iterate a cached extraction, or generate it lazily.
+
+        Consumers that stop early (viewport clipping, ``any()``, first match)
+        skip the remaining work. The result is cached only once the generator
+        has been fully consumed, so a partial walk never leaves a truncated
+        list behind.
+
+        Args:
+            attr: Name of the ``_cached_*`` attribute holding the list
+            generate: Generator function producing the items
+
+        Yields:
+            Extracted items in the same order as the list-returning method
+        """
+        cached = getattr(self, attr)
+        if cached is not None:
+            yield from cached
+            return
+
+        items = []
+        for item in generate():
+            items.append(item)
+            yield item
+        setattr(self, attr, items)
+
     def extract_text_blocks(self) -> List[TextBlock]:
         """Extract text blocks with styling."""
         # Return cached result if available
         if self._cached_text_blocks is not None:
             return self._cached_text_blocks
+        return self._build_text_blocks(None)
+
+    def extract_text_and_chars(self) -> Tuple[List[TextBlock], List[CharInfo]]:
+        """Extract text blocks and characters in one pass over the text dict."""
+        if self._cached_text_blocks is None:
+            if self._cached_chars is None:
+                chars: List[CharInfo] = []
+                self._build_text_blocks(chars)
+                self._cached_chars = chars
+            else:
+                self._build_text_blocks(None)
+        return self._cached_text_blocks, self.extract_chars()
+
+    def _build_text_blocks(self, chars: Optional[List[CharInfo]]) -> List[TextBlock]:
+        """Build and cache the text blocks, optionally collecting chars too.
+
+        Args:
+            chars: When given, filled with the same CharInfo entries
+                extract_chars() would return, from the same traversal
 
+        Returns:
+            The text blocks
+        """
         blocks = []
-        text_dict = self._page.get_text("dict", flags=pymupdf.TEXT_PRESERVE_WHITESPACE)
+        chars_extend = chars.extend if chars is not None else None
+        text_dict = self._get_text_dict()
 
         # Detect if page uses gradient for text
         text_gradient = self._detect_text_gradient()
@@ -791,33 +1395,26 @@ class PyMuPDFPage(PageBackend):
 
         # Detect symbolic Type3 fonts (where graphics = content, not glyph outlines)
         # Heuristic: symbolic Type3 fonts have stroked drawings, text outline fonts are fill-only
-        type3_fonts = set()
-        for block in text_dict.get("blocks", []):
-            if block.get("type") == 0:
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        font = span.get("font", "")
-                        if "T3" in font or font.startswith("Unnamed"):
-                            type3_fonts.add(font)
-
         # Only skip Type3 text if drawings have stroke operations (symbolic fonts)
-        # Text outline Type3 fonts have fill-only drawings (glyph outlines)
-        if type3_fonts:
-            drawings = self._page.get_drawings()
-            has_stroked_drawings = any(
-                d.get("color") is not None and (d.get("width") or 0) > 0
-                for d in drawings[:100]  # Check first 100 for performance
-            )
-            if not has_stroked_drawings:
-                # Fill-only drawings = text outlines, render text normally
-                type3_fonts = set()
-
+        # Text outline Type3 fonts have fill-only drawings (glyph outlines), so
+        # their text renders normally. Spans are tested in the main pass below
+        # rather than collecting the Type3 font set in a separate one.
+        skip_type3 = self._has_type3_fonts() and self._detect_stroked_drawings()
+
+        # Decide once per page how gradient text is identified, so spans on
+        # pages without gradients never touch the color map
+        use_gradient_matching = bool(text_gradient and text_color_map)
+        use_gradient_fallback = bool(text_gradient and not text_color_map)
+        pattern_texts = {t for t, fill_type in text_color_map.items() if fill_type == "pattern"}
+
+        blocks_append = blocks.append
         for block in text_dict.get("blocks", []):
             if block.get("type") != 0:
                 continue
 
             for line in block.get("lines", []):
                 line_text_parts = []
+                parts_append = line_text_parts.append
                 line_x0 = None
                 line_y0 = None
                 line_x1 = 0
@@ -830,6 +1427,9 @@ class PyMuPDFPage(PageBackend):
                 uses_gradient = False
 
                 for span in line.get("spans", []):
+                    if chars_extend is not None:
+                        _extend_span_chars(chars_extend, span)
+
                     text = span.get("text", "")
                     if not text:
                         continue
@@ -837,63 +1437,54 @@ class PyMuPDFPage(PageBackend):
                     font = span.get("font", "Helvetica")
 
                     # Skip Type 3 fonts - their graphics are in get_drawings()
-                    if font in type3_fonts:
+                    if skip_type3 and _is_type3_font(font):
                         continue
 
-                    bbox = span.get("bbox", (0, 0, 0, 0))
-                    size = span.get("size", 12)
-                    color = span.get("color", 0)
-                    flags = span.get("flags", 0)
+                    span_get = span.get
+                    x0, y0, x1, y1 = span_get("bbox", (0, 0, 0, 0))
+                    size = span_get("size", 12)
+                    color = span_get("color", 0)
+                    flags = span_get("flags", 0)
 
                     if line_x0 is None:
-                        line_x0 = bbox[0]
-                        line_y0 = bbox[1]
+                        line_x0 = x0
+                        line_y0 = y0
                         line_font = font
                         line_size = size
 
                         if isinstance(color, int):
-                            r = (color >> 16) & 0xFF
-                            g = (color >> 8) & 0xFF
-                            b = color & 0xFF
-                            line_color = f"#{r:02x}{g:02x}{b:02x}"
+                            line_color = _srgb_to_hex(color)
 
                             # Check if this text uses gradient based on content stream parsing
-                            if text_gradient and text_color_map:
+                            if use_gradient_matching:
                                 # Check if any part of this text uses pattern fill
                                 # Use flexible matching since text can be truncated differently
-                                if text_color_map.get(text) == "pattern":
+                                if text in pattern_texts:
                                     uses_gradient = True
                                 else:
-                                    # Try prefix matching
-                                    for map_text, fill_type in text_color_map.items():
-                                        if fill_type == "pattern":
-                                            # Check if either starts with the other
-                                            if (
-                                                text.startswith(map_text[:20])
-                                                or map_text.startswith(text[:20])
-                                            ):
-                                                uses_gradient = True
-                                                break
-                            elif color == 0 and text_gradient and not text_color_map:
+                                    # Try prefix matching: either starts with the other
+                                    text_prefix = text[:20]
+                                    for map_text in pattern_texts:
+                                        if text.startswith(map_text[:20]) or map_text.startswith(
+                                            text_prefix
+                                        ):
+                                            uses_gradient = True
+                                            break
+                            elif color == 0 and use_gradient_fallback:
                                 # Fallback: if color is black and we have a gradient but no map
                                 uses_gradient = True
 
-                        line_bold = bool(flags & 16)
-                        line_italic = bool(flags & 2)
+                        line_bold, line_italic = _font_style(font, flags)
 
-                        font_lower = font.lower()
-                        if "bold" in font_lower:
-                            line_bold = True
-                        if "italic" in font_lower or "oblique" in font_lower:
-                            line_italic = True
-
-                    line_text_parts.append(text)
-                    line_x1 = max(line_x1, bbox[2])
-                    line_height = max(line_height, bbox[3] - bbox[1])
+                    parts_append(text)
+                    if x1 > line_x1:
+                        line_x1 = x1
+                    if y1 - y0 > line_height:
+                        line_height = y1 - y0
 
                 line_text = "".join(line_text_parts).strip()
                 if line_text and line_x0 is not None:
-                    blocks.append(
+                    blocks_append(
                         TextBlock(
                             text=line_text,
                             x=line_x0,
@@ -920,7 +1511,8 @@ class PyMuPDFPage(PageBackend):
             return self._cached_chars
 
         chars = []
-        text_dict = self._page.get_text("dict", flags=pymupdf.TEXT_PRESERVE_WHITESPACE)
+        chars_extend = chars.extend
+        text_dict = self._get_text_dict()
 
         for block in text_dict.get("blocks", []):
             if block.get("type") != 0:
@@ -928,182 +1520,220 @@ class PyMuPDFPage(PageBackend):
 
             for line in block.get("lines", []):
                 for span in line.get("spans", []):
-                    font = span.get("font", "Helvetica")
-                    size = span.get("size", 12)
-                    color = span.get("color", 0)
-
-                    if isinstance(color, int):
-                        r = (color >> 16) & 0xFF
-                        g = (color >> 8) & 0xFF
-                        b = color & 0xFF
-                        hex_color = f"#{r:02x}{g:02x}{b:02x}"
-                    else:
-                        hex_color = "#000000"
-
-                    span_chars = span.get("chars", [])
-                    if span_chars:
-                        for char_info in span_chars:
-                            c = char_info.get("c", "")
-                            if not c:
-                                continue
-                            bbox = char_info.get("bbox", (0, 0, 0, 0))
-                            chars.append(
-                                CharInfo(
-                                    char=c,
-                                    x=bbox[0],
-                                    y=bbox[1],
-                                    width=bbox[2] - bbox[0],
-                                    height=bbox[3] - bbox[1],
-                                    font_name=font,
-                                    font_size=size,
-                                    color=hex_color,
-                                )
-                            )
-                    else:
-                        text = span.get("text", "")
-                        if text.strip():
-                            bbox = span.get("bbox", (0, 0, 0, 0))
-                            char_width = (bbox[2] - bbox[0]) / max(len(text), 1)
-                            x = bbox[0]
-                            for c in text:
-                                chars.append(
-                                    CharInfo(
-                                        char=c,
-                                        x=x,
-                                        y=bbox[1],
-                                        width=char_width,
-                                        height=bbox[3] - bbox[1],
-                                        font_name=font,
-                                        font_size=size,
-                                        color=hex_color,
-                                    )
-                                )
-                                x += char_width
+                    _extend_span_chars(chars_extend, span)
 
         self._cached_chars = chars
         return chars
 
-    def extract_images(self) -> List[ImageInfo]:
+    def extract_chars_arrays(self) -> Dict[str, Union[array, str]]:
+        """Extract characters as parallel columns (cached)."""
+        if self._cached_char_arrays is None:
+            self._cached_char_arrays = super().extract_chars_arrays()
+        return self._cached_char_arrays
+
+    def extract_images(self, write_files: bool = True) -> List[ImageInfo]:
         """Extract images from the page.
 
-        Images are rendered in page context to preserve colorspace transformations
+        Plain DeviceRGB images are written out as stored in the PDF. Everything
+        else is rendered in page context to preserve colorspace transformations
         (CalRGB, ICC profiles, etc.).
+
+        Args:
+            write_files: Whether to write each image to a temp file (png_path).
+                When False, the encoded data is returned in image_bytes instead;
+                that result is not cached since it holds every image in memory.
         """
-        # Return cached result if available, but validate files still exist
-        if self._cached_images is not None:
-            # Check if cached image files still exist (may have been cleaned up)
-            if all(
-                Path(img.png_path).exists()
-                for img in self._cached_images
-                if img.png_path
-            ):
-                return self._cached_images
-            # Files were deleted, need to re-extract
-            self._cached_images = None
-            self._temp_image_files.clear()
+        # Return cached result if available. The image files are only removed
+        # by cleanup_temp_files(), which also drops this cache.
+        if write_files and self._cached_images is not None:
+            return self._cached_images
 
         images = []
-
+        # Raw files are written once per document: logos and icons repeated
+        # on many pages share a single xref, owned by the backend
+        raw_files = self._doc._raw_image_files
+        # PyMuPDF is not thread-safe, so image data is read on this thread and
+        # the files are written together afterwards. Each pending entry is
+        # (data, suffix, images waiting for the file, raw xref or None).
+        pending: List[Tuple[bytes, str, List[ImageInfo], Optional[int]]] = []
+        pending_raw: Dict[int, List[ImageInfo]] = {}
+
+        # One page object for the whole pass; _page looks it up on every access
+        page = self._page
         # Use get_image_info for accurate positions and colorspace info
-        image_info_list = self._page.get_image_info()
+        image_info_list = page.get_image_info(xrefs=True)
 
         for img_info in image_info_list:
             try:
                 bbox = img_info.get("bbox")
                 if not bbox:
                     continue
+                bbox = (bbox[0], bbox[1], bbox[2], bbox[3])
 
                 width = img_info.get("width", 0)
                 height = img_info.get("height", 0)
 
-                # Render the image in page context to apply colorspace transformations
-                # This handles CalRGB, ICC profiles, and other colorspaces correctly
-                clip = pymupdf.Rect(bbox)
-
-                # Calculate scale to get original resolution
-                scale_x = width / clip.width if clip.width > 0 else 1
-                scale_y = height / clip.height if clip.height > 0 else 1
-                scale = max(scale_x, scale_y, 1)  # At least 1x
-
-                mat = pymupdf.Matrix(scale, scale)
-                pix = self._page.get_pixmap(matrix=mat, clip=clip, alpha=False)
-
-                # Save as PNG and track for cleanup
-                png_path = tempfile.mktemp(suffix=".png")
-                pix.save(png_path)
-                self._temp_image_files.append(png_path)
-
-                images.append(
-                    ImageInfo(
-                        bbox=(bbox[0], bbox[1], bbox[2], bbox[3]),
-                        width=pix.width,
-                        height=pix.height,
-                        png_path=png_path,
-                    )
-                )
+                image = None
+                if self._can_use_raw_image(img_info):
+                    # Already-encoded stream, no need to re-render it
+                    xref = img_info["xref"]
+                    if write_files and xref in raw_files:
+                        png_path, img_width, img_height = raw_files[xref]
+                        image = ImageInfo(bbox, img_width, img_height, png_path)
+                    elif xref in pending_raw:
+                        waiting = pending_raw[xref]
+                        image = ImageInfo(bbox, waiting[0].width, waiting[0].height)
+                        waiting.append(image)
+                    else:
+                        raw = self._doc._read_raw_image(xref)
+                        if raw:
+                            data, suffix, img_width, img_height = raw
+                            image = ImageInfo(bbox, img_width, img_height)
+                            pending_raw[xref] = [image]
+                            pending.append((data, suffix, pending_raw[xref], xref))
+
+                if image is None:
+                    # Render the image in page context to apply colorspace transformations
+                    # This handles CalRGB, ICC profiles, and other colorspaces correctly
+                    # The bbox tuple is passed as the clip directly; PyMuPDF
+                    # takes rect-likes, so no Rect is built per image
+                    clip_width = bbox[2] - bbox[0]
+                    clip_height = bbox[3] - bbox[1]
+
+                    # Calculate scale to get original resolution
+                    scale_x = width / clip_width if clip_width > 0 else 1
+                    scale_y = height / clip_height if clip_height > 0 else 1
+                    scale = max(scale_x, scale_y, 1)  # At least 1x
+
+                    mat = pymupdf.Matrix(scale, scale)
+                    pix = page.get_pixmap(matrix=mat, clip=bbox, alpha=False)
+
+                    # Encode as PNG
+                    image = ImageInfo(bbox, pix.width, pix.height)
+                    pending.append((pix.tobytes("png"), ".png", [image], None))
+                    # Release the pixmap right away so MuPDF can reuse its buffer
+                    del pix
+
+                images.append(image)
             except Exception:
                 continue
 
+        if not write_files:
+            for data, _, waiting, _ in pending:
+                for image in waiting:
+                    image.image_bytes = data
+            return images
+
+        if pending:
+            paths = _write_temp_files([(data, suffix) for data, suffix, _, _ in pending])
+            for (_, _, waiting, xref), path in zip(pending, paths):
+                if path is None:
+                    continue
+                for image in waiting:
+                    image.png_path = path
+                if xref is None:
+                    # Track for cleanup
+                    self._temp_image_files.append(path)
+                else:
+                    raw_files[xref] = (path, waiting[0].width, waiting[0].height)
+            # Drop images whose file could not be written
+            images = [image for image in images if image.png_path]
+
         self._cached_images = images
         return images
 
+    def _can_use_raw_image(self, img_info: dict) -> bool:
+        """Check if an image can be used as stored, without rendering it.
+
+        Only upright DeviceRGB images without masks qualify. Anything else
+        needs page context for its colorspace, transparency or placement.
+        """
+        xref = img_info.get("xref", 0)
+        if not xref or img_info.get("cs-name") != "DeviceRGB":
+            return False
+
+        a, b, c, d = tuple(img_info.get("transform", (0, 0, 0, 0)))[:4]
+        if b or c or a <= 0 or d <= 0:
+            return False
+
+        # Already written out for another placement, so its masks were checked
+        if xref in self._doc._raw_image_files:
+            return True
+
+        doc = self._doc._doc
+        return (
+            doc.xref_get_key(xref, "SMask")[0] == "null"
+            and doc.xref_get_key(xref, "Mask")[0] == "null"
+        )
+
+    @property
+    def _has_temp_files(self) -> bool:
+        """Whether this page has written temp image files of its own."""
+        return bool(self._temp_image_files)
+
     def cleanup_temp_files(self):
         """Clean up temporary image files created by this page."""
         for path in self._temp_image_files:
             try:
-                if Path(path).exists():
-                    Path(path).unlink()
-            except Exception:
+                os.remove(path)
+            except OSError:
                 pass
         self._temp_image_files.clear()
+        # Cached images point at the files just removed
+        self._cached_images = None
 
     def _extract_gradient_fills(self) -> List[GraphicsInfo]:
-        """Extract gradient-filled shapes from content stream."""
+        """Extract gradient-filled shapes from content stream (cached)."""
+        if self._cached_gradient_fills is None:
+            self._cached_gradient_fills = self._parse_gradient_fills()
+        return self._cached_gradient_fills
+
+    def _parse_gradient_fills(self) -> List[GraphicsInfo]:
+        """Parse gradient-filled rectangles out of the content stream."""
         graphics = []
-        shadings = self._extract_shadings()
-        if not shadings:
+        if not self._has_pattern_resources():
             return graphics
 
         try:
-            contents = self._page.read_contents()
-            if not contents:
+            # No scn operator means no pattern fills, so skip resource parsing
+            content = self._get_content()
+            if b"scn" not in content:
                 return graphics
 
-            content_str = contents.decode("latin-1", errors="replace")
+            shadings = self._extract_shadings()
+            if not shadings:
+                return graphics
 
             # Look for pattern usage: either "/Pattern cs" or "/Rname cs" where Rname is a pattern colorspace
             # Also check for scn which sets the pattern
             # Pattern: /Rname cs /Pname scn ... x y w h re f
-            pattern_match = re.search(r"/(\w+)\s+scn", content_str)
+            pattern_match = _RE_SCN.search(content)
             if not pattern_match:
                 return graphics
 
-            pattern_name = pattern_match.group(1)
+            pattern_name = pattern_match.group(1).decode("latin-1")
             if pattern_name not in shadings:
                 return graphics
 
             gradient = shadings[pattern_name]
 
             # Find rectangle fills: x y w h re f
-            # The pattern is: number number number number re ... f
-            rect_pattern = r"([\d.]+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s+re\s*\n?f"
-            for match in re.finditer(rect_pattern, content_str):
+            append = graphics.append
+            for match in _RE_RECT_FILL.finditer(content):
                 try:
-                    x = float(match.group(1))
-                    y = float(match.group(2))
-                    w = float(match.group(3))
-                    h = float(match.group(4))
-                    # PDF coordinates: y increases upward, convert to top-left origin
-                    # bbox is (x0, y0, x1, y1) where y0 < y1
-                    graphics.append(
-                        GraphicsInfo(
-                            type="rect",
-                            bbox=(x, y, x + w, y + h),
-                            fill_gradient=gradient,
-                        )
-                    )
-                except (ValueError, IndexError):
+                    # float() parses ASCII bytes directly
+                    x, y, w, h = map(float, match.groups())
+                except ValueError:
                     continue
+                # PDF coordinates: y increases upward, convert to top-left origin
+                # bbox is (x0, y0, x1, y1) where y0 < y1
+                append(
+                    GraphicsInfo(
+                        type="rect",
+                        bbox=(x, y, x + w, y + h),
+                        fill_gradient=gradient,
+                    )
+                )
 
         except Exception:
             pass
@@ -1157,6 +1787,22 @@ class PyMuPDFPage(PageBackend):
 
         return (first_half, border_width)
 
+    def _get_soft_mask_compositing(self, drawings: list) -> Tuple[set, dict]:
+        """Get soft mask compositing results for this page (cached).
+
+        Args:
+            drawings: The page's drawings, as returned by get_drawings()
+
+        Returns:
+            skip_indices and color_overrides, see _detect_soft_mask_compositing
+        """
+        if self._cached_skip_indices is None or self._cached_color_overrides is None:
+            (
+                self._cached_skip_indices,
+                self._cached_color_overrides,
+            ) = self._detect_soft_mask_compositing(drawings)
+        return self._cached_skip_indices, self._cached_color_overrides
+
     def _detect_soft_mask_compositing(
         self, drawings: list
     ) -> Tuple[set, dict]:
@@ -1175,118 +1821,141 @@ class PyMuPDFPage(PageBackend):
         skip_indices = set()
         color_overrides = {}
 
-        # Find colored backgrounds (non-black, non-white, non-gray fills)
+        # Classify every drawing once: mask construct kind, cached rect
+        # tuple, and whether it is a colored background
+        kinds: List[int] = []
+        rects: List[Optional[Tuple[float, float, float, float]]] = []
         colored_backgrounds = []
+        has_black_path = False
         for i, d in enumerate(drawings):
             fill = d.get("fill")
-            if fill and len(d.get("items", [])) > 1:  # Complex path (not simple rect)
+            items = d.get("items", [])
+            num_items = len(items)
+            rect = d.get("rect")
+            rects.append(_rect_tuple(rect) if rect else None)
+
+            kind = _MASK_NONE
+            if fill == (1.0, 1.0, 1.0):
+                if num_items == 1 and items[0][0] == "re":
+                    # White rect - likely mask construct
+                    kind = _MASK_WHITE_RECT
+            elif fill == (0.0, 0.0, 0.0):
+                if num_items == 1 and items[0][0] == "re":
+                    # Black rect - border or shadow
+                    kind = _MASK_BLACK_RECT
+                elif num_items > 1:
+                    # Black path - could be the mask shape (checkmark, icon, etc.)
+                    kind = _MASK_BLACK_PATH
+                    has_black_path = True
+            elif fill and num_items > 1:  # Complex path (not simple rect)
                 # Check if it's a "colorful" fill (not grayscale)
                 r, g, b = fill
                 if not (r == g == b) or (r > 0.3 and r < 0.9):  # Has color or mid-gray
-                    colored_backgrounds.append((i, d))
+                    colored_backgrounds.append(i)
+            kinds.append(kind)
+
+        # The compositing pattern always needs a black path to render white
+        if not colored_backgrounds or not has_black_path:
+            return skip_indices, color_overrides
 
-        for bg_idx, bg_drawing in colored_backgrounds:
-            bg_rect = bg_drawing.get("rect")
-            if not bg_rect:
+        num_drawings = len(drawings)
+        for bg_idx in colored_backgrounds:
+            bg_rect = rects[bg_idx]
+            if bg_rect is None:
                 continue
+            bg_x0, bg_y0, bg_x1, bg_y1 = bg_rect
 
             # Look for soft mask pattern in subsequent drawings
             # Pattern: black rect -> white rect -> black path -> white rect
             # within the background's bounding box
-            mask_candidates = []
-            for j in range(bg_idx + 1, min(bg_idx + 10, len(drawings))):
-                d = drawings[j]
-                rect = d.get("rect")
-                if not rect:
+            # Candidates kept as parallel int lists: kind and drawing index
+            cand_kinds: List[int] = []
+            cand_indices: List[int] = []
+            for j in range(bg_idx + 1, min(bg_idx + 10, num_drawings)):
+                kind = kinds[j]
+                rect = rects[j]
+                if kind == _MASK_NONE or rect is None:
                     continue
 
                 # Check if this drawing is inside/overlapping the background
-                if not (
-                    rect.x0 < bg_rect.x1
-                    and rect.x1 > bg_rect.x0
-                    and rect.y0 < bg_rect.y1
-                    and rect.y1 > bg_rect.y0
-                ):
-                    continue
-
-                fill = d.get("fill")
-                items = d.get("items", [])
-                is_rect = len(items) == 1 and items[0][0] == "re"
-                is_path = len(items) > 1
-
-                if fill == (1.0, 1.0, 1.0) and is_rect:
-                    # White rect - likely mask construct
-                    mask_candidates.append(("white_rect", j))
-                elif fill == (0.0, 0.0, 0.0) and is_rect:
-                    # Black rect - border or shadow
-                    mask_candidates.append(("black_rect", j))
-                elif fill == (0.0, 0.0, 0.0) and is_path:
-                    # Black path - could be the mask shape (checkmark, icon, etc.)
-                    mask_candidates.append(("black_path", j))
+                x0, y0, x1, y1 = rect
+                if x0 < bg_x1 and x1 > bg_x0 and y0 < bg_y1 and y1 > bg_y0:
+                    cand_kinds.append(kind)
+                    cand_indices.append(j)
 
             # Detect the compositing pattern:
             # black_rect -> white_rect -> black_path -> white_rect
-            if len(mask_candidates) >= 3:
-                types = [c[0] for c in mask_candidates]
-                # Look for: (black_rect?, white_rect, black_path, white_rect)
-                for k, (ctype, cidx) in enumerate(mask_candidates):
-                    if ctype == "black_path":
-                        # Check if surrounded by white rects
-                        has_white_before = any(
-                            t == "white_rect" for t, _ in mask_candidates[:k]
-                        )
-                        has_white_after = any(
-                            t == "white_rect" for t, _ in mask_candidates[k + 1 :]
-                        )
-                        if has_white_before and has_white_after:
-                            # This is a soft mask pattern!
-                            # Skip white rects, render black path as white
-                            for t, idx in mask_candidates:
-                                if t == "white_rect":
-                                    skip_indices.add(idx)
-                                elif t == "black_rect":
-                                    skip_indices.add(idx)
-                            # Render the black path as white
-                            color_overrides[cidx] = "#ffffff"
-                            break
+            if len(cand_kinds) < 3 or _MASK_WHITE_RECT not in cand_kinds:
+                continue
+
+            # A black path is surrounded by white rects when it sits strictly
+            # between the first and last white rect candidates
+            first_white = cand_kinds.index(_MASK_WHITE_RECT)
+            last_white = len(cand_kinds) - 1 - cand_kinds[::-1].index(_MASK_WHITE_RECT)
+            for k in range(first_white + 1, last_white):
+                if cand_kinds[k] == _MASK_BLACK_PATH:
+                    # This is a soft mask pattern!
+                    # Skip white and black rects, render black path as white
+                    for t, idx in zip(cand_kinds, cand_indices):
+                        if t != _MASK_BLACK_PATH:
+                            skip_indices.add(idx)
+                    # Render the black path as white
+                    color_overrides[cand_indices[k]] = "#ffffff"
+                    break
 
         return skip_indices, color_overrides
 
     def extract_graphics(self) -> List[GraphicsInfo]:
         """Extract vector graphics (rects, lines, paths, curves)."""
         # Return cached result if available
+        if self._cached_graphics is None:
+            self._cached_graphics = list(self._generate_graphics())
+        return self._cached_graphics
+
+    def iter_graphics(self, viewport: Optional[Rect] = None) -> Iterator[GraphicsInfo]:
+        """Iterate vector graphics lazily (see _iter_cached).
+
+        With a viewport, drawings outside it are skipped before any path
+        building. That walk is partial, so it is not cached; once the full
+        list is cached it is filtered instead.
+        """
+        if viewport is None:
+            return self._iter_cached("_cached_graphics", self._generate_graphics)
         if self._cached_graphics is not None:
-            return self._cached_graphics
+            return super().iter_graphics(viewport)
+        return self._generate_graphics(viewport)
 
-        graphics = []
+    def _generate_graphics(self, viewport: Optional[Rect] = None) -> Iterator[GraphicsInfo]:
+        """Yield vector graphics one at a time, in extraction order.
+
+        Args:
+            viewport: Skip drawings whose rect misses this (x0, y0, x1, y1) area
+        """
+        if viewport is None:
+            # Bounds that every drawing intersects, so the culling test below
+            # needs no separate None check
+            vx0 = vy0 = float("-inf")
+            vx1 = vy1 = float("inf")
+        else:
+            vx0, vy0, vx1, vy1 = viewport
 
         # First, add gradient-filled shapes
-        graphics.extend(self._extract_gradient_fills())
+        for gfx in self._extract_gradient_fills():
+            x0, y0, x1, y1 = gfx.bbox
+            if x0 <= vx1 and x1 >= vx0 and y0 <= vy1 and y1 >= vy0:
+                yield gfx
 
-        drawings = self._page.get_drawings()
+        drawings = self._get_drawings()
 
         # Detect if this page has text-outline Type3 fonts (fill-only drawings)
         # If so, skip those drawings as they're glyph outlines rendered via text
-        skip_fill_only = False
-        text_dict = self._page.get_text("dict", flags=pymupdf.TEXT_PRESERVE_WHITESPACE)
-        has_type3 = any(
-            "T3" in span.get("font", "") or span.get("font", "").startswith("Unnamed")
-            for block in text_dict.get("blocks", [])
-            if block.get("type") == 0
-            for line in block.get("lines", [])
-            for span in line.get("spans", [])
+        # Fill-only drawings alongside Type3 fonts are glyph outlines
+        skip_fill_only = (
+            self._has_type3_fonts() and not self._detect_stroked_drawings()
         )
-        if has_type3:
-            # Check if drawings are fill-only (text outlines)
-            has_stroked = any(
-                d.get("color") is not None and (d.get("width") or 0) > 0
-                for d in drawings[:100]
-            )
-            if not has_stroked:
-                skip_fill_only = True  # Skip fill-only drawings (glyph outlines)
 
         # Detect soft mask compositing patterns (checkboxes, icons, etc.)
-        skip_indices, color_overrides = self._detect_soft_mask_compositing(drawings)
+        skip_indices, color_overrides = self._get_soft_mask_compositing(drawings)
 
         for idx, drawing in enumerate(drawings):
             # Skip drawings that are soft mask constructs
@@ -1295,6 +1964,9 @@ class PyMuPDFPage(PageBackend):
             rect = drawing.get("rect")
             if not rect:
                 continue
+            # Viewport culling, before any color or path work
+            if rect.x0 > vx1 or rect.x1 < vx0 or rect.y0 > vy1 or rect.y1 < vy0:
+                continue
 
             fill = drawing.get("fill")
             color = drawing.get("color")
@@ -1345,21 +2017,23 @@ class PyMuPDFPage(PageBackend):
             dashes_str = drawing.get("dashes")
             stroke_dashes = None
             if dashes_str:
-                # Parse dash pattern like "[ 1.5 1.5 ] 0"
-                import re as re_mod
-
-                dash_match = re_mod.search(r"\[\s*([\d.\s]+)\s*\]", dashes_str)
-                if dash_match:
-                    stroke_dashes = [float(x) for x in dash_match.group(1).split()]
+                dash_array = _parse_dashes(dashes_str)
+                if dash_array:
+                    stroke_dashes = list(dash_array)
 
             items = drawing.get("items", [])
             if not items:
                 continue
 
-            # Build path commands from all items in this drawing
-            path_commands = []
-            points = []
-            current_pos = None  # Track current position for proper path building
+            # Build path commands from all items in this drawing, stored flat:
+            # one opcode per command and its coordinates packed in an array
+            path_ops = []
+            path_coords = array("d")
+            ops_append = path_ops.append
+            coords_extend = path_coords.extend
+            # Track current position for proper path building, as two floats
+            # rather than a tuple allocated per segment
+            cur_x = cur_y = None
 
             for item in items:
                 cmd = item[0]
@@ -1367,278 +2041,352 @@ class PyMuPDFPage(PageBackend):
                 if cmd == "re":  # Rectangle
                     r = item[1]
                     if r.width >= 1 or r.height >= 1:
-                        graphics.append(
-                            GraphicsInfo(
-                                type="rect",
-                                bbox=(r.x0, r.y0, r.x1, r.y1),
-                                linewidth=width,
-                                stroke_color=stroke_hex,
-                                fill_color=fill_hex,
-                                stroke_dashes=stroke_dashes,
-                            )
+                        yield GraphicsInfo(
+                            type="rect",
+                            bbox=_rect_tuple(r),
+                            linewidth=width,
+                            stroke_color=stroke_hex,
+                            fill_color=fill_hex,
+                            stroke_dashes=stroke_dashes,
                         )
 
                 elif cmd == "l":  # Line from p1 to p2
                     p1, p2 = item[1], item[2]
-                    points.append((p1.x, p1.y))
-                    points.append((p2.x, p2.y))
                     # Only add moveto if we're not already at p1
-                    if current_pos != (p1.x, p1.y):
-                        path_commands.append(("m", p1.x, p1.y))
-                    path_commands.append(("l", p2.x, p2.y))
-                    current_pos = (p2.x, p2.y)
+                    if p1.x != cur_x or p1.y != cur_y:
+                        ops_append("m")
+                        coords_extend((p1.x, p1.y))
+                    ops_append("l")
+                    cur_x = p2.x
+                    cur_y = p2.y
+                    coords_extend((cur_x, cur_y))
 
                 elif cmd == "c":  # Cubic bezier: start at p1, controls p2/p3, end at p4
                     p1, p2, p3, p4 = item[1], item[2], item[3], item[4]
-                    points.extend(
-                        [
-                            (p1.x, p1.y),
-                            (p2.x, p2.y),
-                            (p3.x, p3.y),
-                            (p4.x, p4.y),
-                        ]
-                    )
                     # Only add moveto if we're not already at p1
-                    if current_pos != (p1.x, p1.y):
-                        path_commands.append(("m", p1.x, p1.y))
-                    path_commands.append(("c", p2.x, p2.y, p3.x, p3.y, p4.x, p4.y))
-                    current_pos = (p4.x, p4.y)
+                    if p1.x != cur_x or p1.y != cur_y:
+                        ops_append("m")
+                        coords_extend((p1.x, p1.y))
+                    ops_append("c")
+                    cur_x = p4.x
+                    cur_y = p4.y
+                    coords_extend((p2.x, p2.y, p3.x, p3.y, cur_x, cur_y))
 
                 elif cmd == "qu":  # Quad (4 points)
                     quad = item[1]
-                    pts = [
-                        (quad.ul.x, quad.ul.y),
-                        (quad.ur.x, quad.ur.y),
-                        (quad.lr.x, quad.lr.y),
-                        (quad.ll.x, quad.ll.y),
-                    ]
-                    points.extend(pts)
-                    path_commands.append(("m", pts[0][0], pts[0][1]))
-                    for pt in pts[1:]:
-                        path_commands.append(("l", pt[0], pt[1]))
-                    path_commands.append(("h",))  # Close path
-                    current_pos = (pts[0][0], pts[0][1])  # Closed path returns to start
+                    ul, ur, lr, ll = quad.ul, quad.ur, quad.lr, quad.ll
+                    # Moveto the first corner, lineto the other three, close
+                    path_ops.extend("mlllh")
+                    coords_extend((ul.x, ul.y, ur.x, ur.y, lr.x, lr.y, ll.x, ll.y))
+                    # Closed path returns to start
+                    cur_x = ul.x
+                    cur_y = ul.y
 
             # If we collected path commands, create a path graphic
-            if path_commands and len(path_commands) > 1:
-                # Calculate bounding box from points
-                if points:
-                    xs = [p[0] for p in points]
-                    ys = [p[1] for p in points]
-                    bbox = (min(xs), min(ys), max(xs), max(ys))
-                else:
-                    bbox = (rect.x0, rect.y0, rect.x1, rect.y1)
-
-                graphics.append(
-                    GraphicsInfo(
-                        type="path",
-                        bbox=bbox,
-                        linewidth=width,
-                        stroke_color=stroke_hex,
-                        fill_color=fill_hex,
-                        path_commands=path_commands,
-                        points=points,
-                        stroke_dashes=stroke_dashes,
-                    )
+            if len(path_ops) > 1:
+                # Every point the path visits is in path_coords (x, y interleaved),
+                # so strided slices give the bounding box and the points list
+                xs = path_coords[0::2]
+                ys = path_coords[1::2]
+                bbox = (min(xs), min(ys), max(xs), max(ys))
+
+                yield GraphicsInfo(
+                    type="path",
+                    bbox=bbox,
+                    linewidth=width,
+                    stroke_color=stroke_hex,
+                    fill_color=fill_hex,
+                    points=list(zip(xs, ys)),
+                    path_ops="".join(path_ops),
+                    path_coords=path_coords,
+                    stroke_dashes=stroke_dashes,
                 )
 
-        self._cached_graphics = graphics
-        return graphics
-
     def get_annotations(self) -> List[AnnotationInfo]:
         """Get all annotations on the page."""
         # Return cached result if available
-        if self._cached_annotations is not None:
-            return self._cached_annotations
+        if self._cached_annotations is None:
+            self._cached_annotations = list(self._generate_annotations())
+        return self._cached_annotations
 
-        annotations = []
+    def iter_annotations(self) -> Iterator[AnnotationInfo]:
+        """Iterate annotations lazily (see _iter_cached)."""
+        return self._iter_cached("_cached_annotations", self._generate_annotations)
 
+    def _generate_annotations(self) -> Iterator[AnnotationInfo]:
+        """Yield annotations one at a time."""
         for annot in self._page.annots() or []:
-            annot_type = annot.type[0] if annot.type else -1
-            annot_name = annot.type[1] if annot.type else "Unknown"
-            rect = annot.rect
-            colors = annot.colors or {}
+            # Annot attributes are properties that call into MuPDF, so each
+            # one is read exactly once
+            type_info = annot.type
+            if type_info:
+                annot_type, annot_name = type_info[0], type_info[1]
+            else:
+                annot_type, annot_name = -1, "Unknown"
 
-            stroke = colors.get("stroke", (1.0, 1.0, 0.0))
+            stroke = (annot.colors or {}).get("stroke")
             if isinstance(stroke, (list, tuple)) and len(stroke) >= 3:
                 color = (stroke[0], stroke[1], stroke[2])
             else:
-                color = (1.0, 1.0, 0.0)
-
-            border = annot.border or {}
-            border_width = border.get("width", 1.0)
-
-            annotations.append(
-                AnnotationInfo(
-                    type=annot_type,
-                    type_name=annot_name,
-                    rect=(rect.x0, rect.y0, rect.x1, rect.y1),
-                    color=color,
-                    contents=annot.info.get("content", ""),
-                    vertices=annot.vertices,
-                    border_width=border_width,
-                )
+                color = _DEFAULT_ANNOT_COLOR
+
+            yield AnnotationInfo(
+                type=annot_type,
+                type_name=annot_name,
+                rect=_rect_tuple(annot.rect),
+                color=color,
+                contents=annot.info.get("content", ""),
+                vertices=annot.vertices if annot_type in _VERTEX_ANNOT_TYPES else None,
+                border_width=(annot.border or {}).get("width", 1.0),
             )
 
-        self._cached_annotations = annotations
-        return annotations
-
     def get_links(self) -> List[LinkInfo]:
         """Get all links on the page."""
         # Return cached result if available
-        if self._cached_links is not None:
-            return self._cached_links
+        if self._cached_links is None:
+            self._cached_links = list(self._generate_links())
+        return self._cached_links
 
-        links = []
+    def iter_links(self) -> Iterator[LinkInfo]:
+        """Iterate links lazily (see _iter_cached)."""
+        return self._iter_cached("_cached_links", self._generate_links)
 
+    def _generate_links(self) -> Iterator[LinkInfo]:
+        """Yield links one at a time."""
+        get_builder = _LINK_BUILDERS.get
         for link in self._page.get_links():
-            rect = link.get("from", pymupdf.Rect())
-            kind = link.get("kind", 0)
-
-            # Map PyMuPDF link kinds to our type
-            # LINK_NONE=0, LINK_GOTO=1, LINK_URI=2, LINK_LAUNCH=3, LINK_NAMED=4, LINK_GOTOR=5
-            if kind == pymupdf.LINK_GOTO:
-                # Internal link to a page
-                page_num = link.get("page", 0)
-                links.append(
-                    LinkInfo(
-                        rect=(rect.x0, rect.y0, rect.x1, rect.y1),
-                        kind="goto",
-                        page=page_num,
-                    )
-                )
-            elif kind == pymupdf.LINK_URI:
-                # External URL
-                uri = link.get("uri", "")
-                links.append(
-                    LinkInfo(
-                        rect=(rect.x0, rect.y0, rect.x1, rect.y1),
-                        kind="uri",
-                        uri=uri,
-                    )
-                )
-            elif kind == pymupdf.LINK_NAMED:
-                # Named destination
-                name = link.get("name", "")
-                links.append(
-                    LinkInfo(
-                        rect=(rect.x0, rect.y0, rect.x1, rect.y1),
-                        kind="named",
-                        name=name,
-                    )
-                )
-            elif kind == pymupdf.LINK_LAUNCH:
-                # Launch external file/app
-                file_spec = link.get("file", "")
-                links.append(
-                    LinkInfo(
-                        rect=(rect.x0, rect.y0, rect.x1, rect.y1),
-                        kind="launch",
-                        file=file_spec,
-                    )
-                )
-            elif kind == pymupdf.LINK_GOTOR:
-                # Link to another PDF file
-                file_spec = link.get("file", "")
-                page_num = link.get("page", 0)
-                links.append(
-                    LinkInfo(
-                        rect=(rect.x0, rect.y0, rect.x1, rect.y1),
-                        kind="goto",  # Treat as goto for simplicity
-                        page=page_num,
-                        file=file_spec,
-                    )
-                )
-
-        self._cached_links = links
-        return links
+            # Unknown kinds (e.g. LINK_NONE) are skipped before any conversion
+            builder = get_builder(link.get("kind", 0))
+            if builder is not None:
+                # A default passed to get() is built even when unused, so the
+                # empty rect is only substituted for links without "from"
+                rect = link.get("from")
+                yield builder(link, _EMPTY_RECT if rect is None else _rect_tuple(rect))
 
     def search_text(
         self,
         query: str,
         case_sensitive: bool = False,
         whole_word: bool = False,
+        need_quads: bool = False,
     ) -> List[SearchResult]:
         """Search for text on this page.
 
         Uses PyMuPDF's search_for method which returns quads/rects
-        for each match occurrence.
+        for each match occurrence. Quads are only requested when the
+        caller asks for them; otherwise plain rects come back directly.
         """
         if not query:
             return []
 
-        results = []
+        # Re-running the same search (e.g. "find next" across pages) reuses
+        # the previous results; callers get their own list to mutate
+        search_key = (query, case_sensitive, whole_word, need_quads)
+        if self._last_search is not None and self._last_search[0] == search_key:
+            return list(self._last_search[1])
 
-        # Build search flags
-        flags = pymupdf.TEXT_PRESERVE_WHITESPACE
-        if not case_sensitive:
-            flags |= pymupdf.TEXT_PRESERVE_LIGATURES
+        results = []
 
         # PyMuPDF search_for returns list of Rect or Quad objects
         # quads=True returns Quad for better accuracy with rotated text
-        matches = self._page.search_for(query, quads=True)
+        page, textpage = self._get_textpage()
+        matches = page.search_for(query, quads=need_quads, textpage=textpage)
+
+        # search_for is always case-insensitive and has no word boundaries,
+        # so check each hit against the chars it covers when either is requested
+        if matches and (whole_word or case_sensitive):
+            hit_rects = [_rect_tuple(m.rect if need_quads else m) for m in matches]
+            keep = self._filter_search_matches(query, hit_rects, case_sensitive, whole_word)
+            matches = [m for m, ok in zip(matches, keep) if ok]
 
         for match in matches:
-            # Each match is a Quad object
-            if hasattr(match, "rect"):
+            if need_quads:
                 # It's a Quad, get the bounding rect
                 rect = match.rect
-                quads = [(match.ul.x, match.ul.y, match.lr.x, match.lr.y)]
+                quads = [_quad_corners(match)]
             else:
                 # It's already a Rect
                 rect = match
                 quads = None
 
-            # Check whole word if required
-            if whole_word:
-                # Get text around the match to verify word boundaries
-                # We extract text from the page and check the match context
-                page_text = self._page.get_text("text")
-                # Simple heuristic: check if the match is a whole word
-                # This is approximate - PyMuPDF doesn't have built-in whole word search
-                match_text = query
-                # For now, include all matches - whole word filtering would need
-                # character-level position checking which is complex
-                pass
-
             results.append(
                 SearchResult(
                     page_index=self._index,
-                    rect=(rect.x0, rect.y0, rect.x1, rect.y1),
+                    rect=_rect_tuple(rect),
                     text=query,
                     quads=quads,
                 )
             )
 
-        return results
+        self._last_search = (search_key, results)
+        return list(results)
 
-    def add_highlight(self, rects: List[Rect], color: Color) -> None:
-        for rect in rects:
-            annot = self._page.add_highlight_annot(pymupdf.Rect(rect))
+    def get_text(self) -> str:
+        """Get the page's plain text in reading order (cached).
+
+        Extraction re-runs PyMuPDF's layout analysis, so the result is kept
+        until invalidate_cache(). Annotations don't contribute to it.
+        """
+        if self._cached_page_text is None:
+            page, textpage = self._get_textpage()
+            self._cached_page_text = page.get_text("text", textpage=textpage)
+        return self._cached_page_text
+
+    def _get_search_lines(self) -> Tuple[List[float], List[Tuple[array, str]]]:
+        """Index the chars of the search TextPage by line, then x (cached).
+
+        The chars come from the same TextPage search_for runs on, so they
+        match its hits whatever ligature or dehyphenation handling it applies.
+
+        Returns:
+            Center y of every line in ascending order, and for each line the
+            center x of its chars (ascending) with the chars as a string
+        """
+        if self._cached_search_lines is None:
+            _, textpage = self._get_textpage()
+            lines = []
+            for block in textpage.extractRAWDICT().get("blocks", []):
+                if block.get("type") != 0:
+                    continue
+                for line in block.get("lines", []):
+                    chars = sorted(
+                        ((char["bbox"][0] + char["bbox"][2]) * 0.5, char["c"])
+                        for span in line.get("spans", [])
+                        for char in span.get("chars", [])
+                    )
+                    if chars:
+                        _, y0, _, y1 = line["bbox"]
+                        centers = array("d", [x for x, _ in chars])
+                        lines.append(((y0 + y1) * 0.5, centers, "".join(c for _, c in chars)))
+            lines.sort(key=operator.itemgetter(0))
+            self._cached_search_lines = (
+                [y for y, _, _ in lines],
+                [(centers, text) for _, centers, text in lines],
+            )
+        return self._cached_search_lines
+
+    def _filter_search_matches(
+        self,
+        query: str,
+        hit_rects: List[Rect],
+        case_sensitive: bool,
+        whole_word: bool,
+    ) -> List[bool]:
+        """Decide which search_for hits satisfy case and word-boundary rules.
+
+        Each hit is checked on its own: the chars of the search TextPage
+        whose centers lie in its rect are the text it matched, found by
+        bisecting the line index. A match that wraps to the next line comes
+        back as one hit per line, so a hit may also cover just the start or
+        the end of the query; the word boundary is then only checked on the
+        side that isn't the line break. Text is compared after NFKC
+        normalization (so ligatures equal their letters), whitespace runs
+        compare equal and a line-end hyphen in front of the break is ignored.
+
+        A hit is dropped if it fails either rule, and also if its chars can't
+        be told apart (none found, or text that isn't the query or part of it).
+
+        Args:
+            query: The searched text
+            hit_rects: Rect (x0, y0, x1, y1) of each hit returned by search_for
+            case_sensitive: Whether the hit must match the query's case
+            whole_word: Whether the hit must sit on word boundaries
+
+        Returns:
+            One keep/drop flag per hit
+        """
+        query = " ".join(unicodedata.normalize("NFKC", query).split())
+        if not query:
+            # Whitespace only: nothing to compare case or boundaries on
+            return [True] * len(hit_rects)
+        target = query if case_sensitive else query.lower()
+        # Queries starting or ending in punctuation (e.g. "=======") have no
+        # word boundary to check on that side
+        check_start = whole_word and _is_word_char(query[0])
+        check_end = whole_word and _is_word_char(query[-1])
+
+        line_ys, lines = self._get_search_lines()
+        keep = []
+        for x0, y0, x1, y1 in hit_rects:
+            # (line text, first, end) of every line slice inside the hit
+            parts = []
+            for line in range(bisect_left(line_ys, y0), bisect_right(line_ys, y1)):
+                centers, line_text = lines[line]
+                first = bisect_left(centers, x0)
+                end = bisect_right(centers, x1)
+                if first < end:
+                    parts.append((centers[first], line_text, first, end))
+            if not parts:
+                keep.append(False)
+                continue
+
+            parts.sort(key=operator.itemgetter(0))
+            text = "".join(line_text[first:end] for _, line_text, first, end in parts)
+            text = " ".join(unicodedata.normalize("NFKC", text).split())
+            if not case_sensitive:
+                text = text.lower()
+
+            # Only chars on the same line touch the hit
+            _, line_text, first, _ = parts[0]
+            starts_word = not (
+                check_start and first > 0 and _is_word_char(line_text[first - 1])
+            )
+            _, line_text, _, end = parts[-1]
+            ends_word = not (
+                check_end and end < len(line_text) and _is_word_char(line_text[end])
+            )
+
+            if text == target:
+                ok = starts_word and ends_word
+            elif text.rstrip("-") and target.startswith(text.rstrip("-")):
+                # First line of a wrapped match
+                ok = starts_word
+            elif target.endswith(text):
+                # Last line of a wrapped match
+                ok = ends_word
+            else:
+                ok = False
+            keep.append(ok)
+        return keep
+
+    def _add_text_markup(self, add_annot, rects: List[Rect], color: Color) -> None:
+        """Add one text markup annotation covering all rects.
+
+        PyMuPDF accepts a list of rects/quads for text markup, so a
+        multi-line selection becomes a single annotation whose appearance
+        stream is generated once instead of once per rect.
+
+        Args:
+            add_annot: Bound page method, e.g. page.add_highlight_annot
+            rects: Rectangles to mark up (x0, y0, x1, y1)
+            color: Stroke color as RGB (0-1)
+        """
+        if not rects:
+            return
+
+        # Rect-likes are converted to quads by PyMuPDF itself
+        try:
+            annots = [add_annot(list(rects))]
+        except (TypeError, ValueError):
+            # Older PyMuPDF without list support: one annotation per rect
+            annots = [add_annot(rect) for rect in rects]
+
+        for annot in annots:
             annot.set_colors(stroke=color)
             annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._invalidate_annotation_cache()
+
+    def add_highlight(self, rects: List[Rect], color: Color) -> None:
+        self._add_text_markup(self._page.add_highlight_annot, rects, color)
 
     def add_underline(self, rects: List[Rect], color: Color) -> None:
-        for rect in rects:
-            annot = self._page.add_underline_annot(pymupdf.Rect(rect))
-            annot.set_colors(stroke=color)
-            annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._add_text_markup(self._page.add_underline_annot, rects, color)
 
     def add_strikethrough(self, rects: List[Rect], color: Color) -> None:
-        for rect in rects:
-            annot = self._page.add_strikeout_annot(pymupdf.Rect(rect))
-            annot.set_colors(stroke=color)
-            annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._add_text_markup(self._page.add_strikeout_annot, rects, color)
 
     def add_squiggly(self, rects: List[Rect], color: Color) -> None:
-        for rect in rects:
-            annot = self._page.add_squiggly_annot(pymupdf.Rect(rect))
-            annot.set_colors(stroke=color)
-            annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._add_text_markup(self._page.add_squiggly_annot, rects, color)
 
     def add_text_note(
         self,
@@ -1647,10 +2395,10 @@ class PyMuPDFPage(PageBackend):
         icon: str = "Note",
         color: Color = (1.0, 0.92, 0.0),
     ) -> None:
-        annot = self._page.add_text_annot(pymupdf.Point(point), text, icon=icon)
+        annot = self._page.add_text_annot(point, text, icon=icon)
         annot.set_colors(stroke=color)
         annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._invalidate_annotation_cache()
 
     def add_ink(
         self,
@@ -1658,30 +2406,40 @@ class PyMuPDFPage(PageBackend):
         color: Color = (0.0, 0.0, 0.0),
         width: float = 2.0,
     ) -> None:
-        ink_list = [[(float(x), float(y)) for x, y in path] for path in paths]
-        annot = self._page.add_ink_annot(ink_list)
+        self._add_ink_annot(self._page, paths, color, width)
+        self._invalidate_annotation_cache()
+
+    def add_inks_grouped(
+        self, strokes_by_style: Dict[Tuple[Color, float], List[InkPath]]
+    ) -> None:
+        page = self._page
+        for (color, width), paths in strokes_by_style.items():
+            if paths:
+                self._add_ink_annot(page, paths, color, width)
+        self._invalidate_annotation_cache()
+
+    @staticmethod
+    def _add_ink_annot(
+        page: pymupdf.Page, paths: List[InkPath], color: Color, width: float
+    ) -> None:
+        """Add all paths as the strokes of a single ink annotation."""
+        # Strokes from DrawingHandler are already lists of float tuples, so
+        # only rebuild the points when the first one says otherwise
+        first = next((path[0] for path in paths if path), None)
+        if first is not None and type(first[0]) is float and type(first[1]) is float:
+            ink_list = paths
+        else:
+            ink_list = [[(float(x), float(y)) for x, y in path] for path in paths]
+        annot = page.add_ink_annot(ink_list)
         annot.set_colors(stroke=color)
         annot.set_border(width=width)
         annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
 
     # Shape annotations
 
     def _line_end_to_pymupdf(self, style: LineEndStyle) -> int:
         """Convert LineEndStyle to PyMuPDF constant."""
-        mapping = {
-            LineEndStyle.NONE: pymupdf.PDF_ANNOT_LE_NONE,
-            LineEndStyle.SQUARE: pymupdf.PDF_ANNOT_LE_SQUARE,
-            LineEndStyle.CIRCLE: pymupdf.PDF_ANNOT_LE_CIRCLE,
-            LineEndStyle.DIAMOND: pymupdf.PDF_ANNOT_LE_DIAMOND,
-            LineEndStyle.OPEN_ARROW: pymupdf.PDF_ANNOT_LE_OPEN_ARROW,
-            LineEndStyle.CLOSED_ARROW: pymupdf.PDF_ANNOT_LE_CLOSED_ARROW,
-            LineEndStyle.BUTT: pymupdf.PDF_ANNOT_LE_BUTT,
-            LineEndStyle.R_OPEN_ARROW: pymupdf.PDF_ANNOT_LE_R_OPEN_ARROW,
-            LineEndStyle.R_CLOSED_ARROW: pymupdf.PDF_ANNOT_LE_R_CLOSED_ARROW,
-            LineEndStyle.SLASH: pymupdf.PDF_ANNOT_LE_SLASH,
-        }
-        return mapping.get(style, pymupdf.PDF_ANNOT_LE_NONE)
+        return _LINE_END_MAP.get(style, pymupdf.PDF_ANNOT_LE_NONE)
 
     def add_freetext(
         self,
@@ -1701,7 +2459,7 @@ class PyMuPDFPage(PageBackend):
         border_color is ignored due to PyMuPDF limitations.
         """
         annot = self._page.add_freetext_annot(
-            pymupdf.Rect(rect),
+            rect,
             text,
             fontsize=font_size,
             fontname=font_name,
@@ -1714,7 +2472,7 @@ class PyMuPDFPage(PageBackend):
         if border_width > 0:
             annot.set_border(width=border_width)
         annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._invalidate_annotation_cache()
 
     def add_rect(
         self,
@@ -1724,11 +2482,11 @@ class PyMuPDFPage(PageBackend):
         width: float = 1.0,
     ) -> None:
         """Add rectangle annotation."""
-        annot = self._page.add_rect_annot(pymupdf.Rect(rect))
+        annot = self._page.add_rect_annot(rect)
         annot.set_colors(stroke=stroke_color, fill=fill_color)
         annot.set_border(width=width)
         annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._invalidate_annotation_cache()
 
     def add_circle(
         self,
@@ -1738,11 +2496,11 @@ class PyMuPDFPage(PageBackend):
         width: float = 1.0,
     ) -> None:
         """Add circle/ellipse annotation."""
-        annot = self._page.add_circle_annot(pymupdf.Rect(rect))
+        annot = self._page.add_circle_annot(rect)
         annot.set_colors(stroke=stroke_color, fill=fill_color)
         annot.set_border(width=width)
         annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._invalidate_annotation_cache()
 
     def add_line(
         self,
@@ -1755,8 +2513,8 @@ class PyMuPDFPage(PageBackend):
     ) -> None:
         """Add line annotation."""
         annot = self._page.add_line_annot(
-            pymupdf.Point(start),
-            pymupdf.Point(end),
+            start,
+            end,
         )
         annot.set_colors(stroke=color)
         annot.set_border(width=width)
@@ -1766,7 +2524,7 @@ class PyMuPDFPage(PageBackend):
             self._line_end_to_pymupdf(end_style),
         )
         annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._invalidate_annotation_cache()
 
     def add_arrow(
         self,
@@ -1796,12 +2554,12 @@ class PyMuPDFPage(PageBackend):
         """Add polygon annotation (closed shape)."""
         if len(points) < 3:
             return
-        pymupdf_points = [pymupdf.Point(p) for p in points]
-        annot = self._page.add_polygon_annot(pymupdf_points)
+        # PyMuPDF converts point-likes itself, (x, y) tuples go straight in
+        annot = self._page.add_polygon_annot(points)
         annot.set_colors(stroke=stroke_color, fill=fill_color)
         annot.set_border(width=width)
         annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._invalidate_annotation_cache()
 
     def add_polyline(
         self,
@@ -1814,8 +2572,8 @@ class PyMuPDFPage(PageBackend):
         """Add polyline annotation (open shape)."""
         if len(points) < 2:
             return
-        pymupdf_points = [pymupdf.Point(p) for p in points]
-        annot = self._page.add_polyline_annot(pymupdf_points)
+        # PyMuPDF converts point-likes itself, (x, y) tuples go straight in
+        annot = self._page.add_polyline_annot(points)
         annot.set_colors(stroke=color)
         annot.set_border(width=width)
         annot.set_line_ends(
@@ -1823,31 +2581,100 @@ class PyMuPDFPage(PageBackend):
             self._line_end_to_pymupdf(end_style),
         )
         annot.update()
-        self._cached_annotations = None  # Invalidate annotation cache
+        self._invalidate_annotation_cache()
 
 
 class PyMuPDFBackend(DocumentBackend):
     """PyMuPDF document backend."""
 
+    __slots__ = (
+        "_path",
+        "_preloaded",
+        "_source_size",
+        "_doc",
+        "_pages",
+        "_page_cache_size",
+        "_raw_image_files",
+        "_extracted_fonts",
+        "_font_buffers",
+        "_font_temp_dir",
+        "_use_relative_paths",
+        "_permissions",
+    )
+
     # Default LRU cache size for page objects
     # Should be larger than the render buffer (5+1+5=11 in continuous mode)
     DEFAULT_PAGE_CACHE_SIZE = 15
 
     def __init__(
         self,
-        source: Union[str, Path, bytes, io.BytesIO],
+        source: Union[str, Path, bytes, bytearray, memoryview, io.BytesIO],
         password: Optional[str] = None,
         page_cache_size: int = DEFAULT_PAGE_CACHE_SIZE,
+        preload: bool = False,
     ):
+        """Open a PDF document.
+
+        Args:
+            source: File path, PDF bytes, or a BytesIO holding them. bytearray
+                and memoryview sources are used without copying, so their
+                contents must not change while the document is open; a
+                memoryview must be contiguous.
+            password: Password for encrypted documents
+            page_cache_size: Number of page objects kept in the LRU cache
+            preload: Read a file source into memory in one go instead of
+                letting MuPDF read it on demand
+
+        Raises:
+            TypeError: If the source type is unsupported or a memoryview
+                source is not contiguous
+            ValueError: If the document is encrypted and the password is
+                missing or wrong
+        """
+        # Only meaningful for file sources: the file was read into memory
+        self._preloaded = False
         if isinstance(source, (str, Path)):
             self._path = Path(source)
-            self._doc = pymupdf.open(str(source))
-        elif isinstance(source, bytes):
+            if preload:
+                # One sequential read instead of MuPDF's on-demand seeks,
+                # much faster on network shares and slow disks
+                data = self._path.read_bytes()
+                self._doc = pymupdf.open(stream=data, filetype="pdf")
+                self._source_size: Optional[int] = len(data)
+                self._preloaded = True
+            else:
+                self._doc = pymupdf.open(str(source))
+                # Stat lazily in source_size; most callers never ask
+                self._source_size = None
+        elif isinstance(source, (bytes, bytearray)):
             self._path = None
+            # Both are taken as-is; callers don't need to copy into bytes.
+            # A bytearray is shared with MuPDF, so it must not change while
+            # the document is open.
             self._doc = pymupdf.open(stream=source, filetype="pdf")
+            self._source_size = len(source)
         elif isinstance(source, io.BytesIO):
             self._path = None
-            self._doc = pymupdf.open(stream=source.read(), filetype="pdf")
+            # getvalue() shares the buffer until the caller writes to it again
+            # (CPython copies on write), unlike getbuffer(), which would pin it
+            # and make the caller's next write or close() fail. Independent of
+            # the stream position, so the caller's stream is not consumed.
+            data = source.getvalue()
+            self._doc = pymupdf.open(stream=data, filetype="pdf")
+            self._source_size = len(data)
+        elif isinstance(source, memoryview):
+            self._path = None
+            # A flat byte view, so nbytes and bytes() describe the file whatever
+            # the caller's format and shape; cast() needs C-contiguous memory
+            if not source.c_contiguous:
+                raise TypeError("memoryview source must be C-contiguous")
+            stream = source.cast("B")
+            self._source_size = stream.nbytes
+            try:
+                self._doc = pymupdf.open(stream=stream, filetype="pdf")
+            except TypeError:
+                # Older PyMuPDF only accepts bytes/bytearray streams
+                self._doc = pymupdf.open(stream=bytes(stream), filetype="pdf")
         else:
             raise TypeError(f"Unsupported source type: {type(source)}")
 
@@ -1858,38 +2685,63 @@ class PyMuPDFBackend(DocumentBackend):
             if not self._doc.authenticate(password):
                 raise ValueError("Invalid password")
 
-        # LRU cache for page objects using OrderedDict
-        from collections import OrderedDict
-
-        self._pages: OrderedDict[int, PyMuPDFPage] = OrderedDict()
+        # LRU cache for page objects. A plain dict keeps insertion order, so
+        # re-inserting on access keeps it in recency order (oldest first)
+        # without OrderedDict's extra linked list.
+        self._pages: Dict[int, PyMuPDFPage] = {}
         self._page_cache_size = max(1, page_cache_size)
 
+        # Images written as stored in the PDF, shared by xref across pages:
+        # xref -> (file path, width, height)
+        self._raw_image_files: Dict[int, Tuple[str, int, int]] = {}
+
         # Font extraction state
         self._extracted_fonts: Optional[Dict[str, str]] = None
+        self._font_buffers: Optional[Dict[str, bytes]] = None
         self._font_temp_dir: Optional[str] = None
         self._use_relative_paths: bool = False
 
+        # Permission flags, computed on first access
+        self._permissions: Optional[Dict[str, bool]] = None
+
     @property
     def page_count(self) -> int:
         return len(self._doc)
 
-    def extract_fonts(self, assets_dir: Optional[str] = None) -> Dict[str, str]:
+    @property
+    def source_size(self) -> int:
+        """Size in bytes of the PDF the document was opened from."""
+        if self._source_size is None:
+            self._source_size = os.path.getsize(self._path)
+        return self._source_size
+
+    def extract_fonts(
+        self, assets_dir: Optional[str] = None, to_memory: bool = False
+    ) -> Dict[str, Union[str, bytes]]:
         """Extract embedded fonts from the PDF.
 
         Args:
             assets_dir: Optional path to assets directory. If provided, fonts
                        are saved there with relative paths for Flet compatibility.
                        If None, fonts are saved to a temp directory.
+            to_memory: Return the converted TTF data instead of writing files;
+                       assets_dir is ignored. Type1 (PFA/PFB) fonts still go
+                       through a short-lived temp file, as fontTools only
+                       parses them from a path.
 
         Returns:
-            Dict mapping clean font names to font paths.
+            Dict mapping clean font names to font paths (or TTF bytes when
+            to_memory is set).
             Use with Flet: page.fonts.update(document.fonts)
         """
+        if to_memory:
+            if self._font_buffers is None:
+                self._font_buffers = self._convert_fonts(self._convert_font_to_memory)
+            return self._font_buffers
+
         if self._extracted_fonts is not None:
             return self._extracted_fonts
 
-        self._extracted_fonts = {}
-
         # Determine where to save fonts
         if assets_dir:
             # Use assets directory - save to fonts subfolder
@@ -1902,61 +2754,141 @@ class PyMuPDFBackend(DocumentBackend):
             self._font_temp_dir = tempfile.mkdtemp(prefix="pdf_fonts_")
             self._use_relative_paths = False
 
-        # Collect all unique font xrefs from all pages
+        self._extracted_fonts = self._convert_fonts(self._convert_font)
+        return self._extracted_fonts
+
+    def _convert_fonts(
+        self, convert: Callable[[str, List[Tuple[str, bytes]]], Optional[Union[str, bytes]]]
+    ) -> Dict[str, Union[str, bytes]]:
+        """Collect every embedded font and convert each one with ``convert``.
+
+        Args:
+            convert: Called with (clean name, candidates); returns the value
+                to store for that font, or None to skip it
+
+        Returns:
+            Dict mapping clean font names to the converted values
+        """
+        # Collect all unique font xrefs from all pages. PyMuPDF is not
+        # thread-safe, so reading font data stays on this thread; candidates
+        # are grouped by clean name in the order they are encountered.
+        candidates: Dict[str, List[Tuple[str, bytes]]] = {}
         seen_xrefs = set()
+        seen_add = seen_xrefs.add
+        get_page_fonts = self._doc.get_page_fonts
+        read_font = self._read_font
         for page_num in range(len(self._doc)):
-            for font_info in self._doc.get_page_fonts(page_num, full=True):
+            for font_info in get_page_fonts(page_num, full=True):
                 xref = font_info[0]
-                if xref not in seen_xrefs:
-                    seen_xrefs.add(xref)
-                    self._extract_single_font(xref)
-
-        return self._extracted_fonts
-
-    def _extract_single_font(self, xref: int) -> None:
-        """Extract a single font by xref and add to extracted_fonts dict.
+                if xref in seen_xrefs:
+                    continue
+                seen_add(xref)
+                font = read_font(xref)
+                if font:
+                    clean_name, ext, buffer = font
+                    candidates.setdefault(clean_name, []).append((ext, buffer))
+
+        # fontTools conversion is pure Python and holds the GIL, so threads
+        # would not convert any faster; fonts are converted in collection order
+        converted = {}
+        for name, font_candidates in candidates.items():
+            path = convert(name, font_candidates)
+            if path:
+                converted[name] = path
+        return converted
+
+    def _read_font(self, xref: int) -> Optional[Tuple[str, str, bytes]]:
+        """Read a single embedded font by xref.
+
+        Supports: TTF, TTC, OTF, CFF (Type1C), PFA, PFB.
 
-        All fonts are converted to TTF for best Flet/Flutter compatibility.
-        Supports: TTF, TTC, OTF, CFF (Type1C).
+        Returns:
+            (clean font name, extension, font data), or None if the font
+            is missing, too small or in an unsupported format
         """
         try:
             extracted = self._doc.extract_font(xref)
             if not extracted:
-                return
+                return None
 
             name, ext, subtype, buffer = extracted
 
             # Skip fonts with no data
             if not buffer or len(buffer) < 100:
-                return
+                return None
 
             # Skip unsupported formats
             if ext not in ("ttf", "ttc", "otf", "cff", "pfa", "pfb"):
-                return
+                return None
 
             # Clean font name (remove subset prefix like "ABCDEF+")
             clean_name = name.split("+")[-1] if "+" in name else name
+            return clean_name, ext, buffer
+
+        except Exception:
+            # Skip fonts that can't be extracted
+            return None
 
-            # Skip if already extracted (same clean name)
-            if clean_name in self._extracted_fonts:
-                return
+    def _convert_font(self, clean_name: str, candidates: List[Tuple[str, bytes]]) -> Optional[str]:
+        """Convert a font to TTF in the font directory.
 
-            # All fonts are saved as TTF for consistency
-            font_path = Path(self._font_temp_dir) / f"{clean_name}.ttf"
+        All fonts are converted to TTF for best Flet/Flutter compatibility.
+        Several embedded fonts can share a clean name (different subsets);
+        they are tried in order until one converts.
 
-            # Convert to TTF (handles TTF, OTF, CFF)
-            if not _convert_font_to_ttf(buffer, ext, str(font_path)):
-                return
+        Args:
+            clean_name: Font name without subset prefix
+            candidates: (extension, font data) pairs for this name
+
+        Returns:
+            Path to register with Flet, or None if no candidate converted
+        """
+        # All fonts are saved as TTF for consistency
+        font_path = Path(self._font_temp_dir) / f"{clean_name}.ttf"
+
+        for ext, buffer in candidates:
+            try:
+                # Convert to TTF (handles TTF, OTF, CFF)
+                if not _convert_font_to_ttf(buffer, ext, str(font_path)):
+                    continue
+            except Exception:
+                continue
 
             # Use relative path for assets, absolute for temp
             if self._use_relative_paths:
-                self._extracted_fonts[clean_name] = f"fonts/{clean_name}.ttf"
-            else:
-                self._extracted_fonts[clean_name] = str(font_path)
+                return f"fonts/{clean_name}.ttf"
+            return str(font_path)
 
-        except Exception:
-            # Skip fonts that can't be extracted
-            pass
+        return None
+
+    def _read_raw_image(self, xref: int) -> Optional[Tuple[bytes, str, int, int]]:
+        """Read an image xref as stored in the PDF.
+
+        Returns:
+            (data, file suffix, width, height), or None if the image is not
+            stored in a format that can be used directly
+        """
+        raw = self._doc.extract_image(xref)
+        if not raw or raw.get("ext") not in ("png", "jpeg", "jpg"):
+            return None
+        return raw["image"], f".{raw['ext']}", raw["width"], raw["height"]
+
+    def _convert_font_to_memory(
+        self, clean_name: str, candidates: List[Tuple[str, bytes]]
+    ) -> Optional[bytes]:
+        """Convert a font to TTF bytes; see _convert_font.
+
+        Returns:
+            TTF data, or None if no candidate converted
+        """
+        for ext, buffer in candidates:
+            out = io.BytesIO()
+            try:
+                if _convert_font_to_ttf(buffer, ext, out):
+                    return out.getvalue()
+            except Exception:
+                continue
+        return None
 
     @property
     def fonts(self) -> Dict[str, str]:
@@ -1988,46 +2920,110 @@ class PyMuPDFBackend(DocumentBackend):
         """
         if not self._doc.is_encrypted:
             return True
-        return self._doc.authenticate(password)
+        authenticated = bool(self._doc.authenticate(password))
+        if authenticated:
+            # Owner and user passwords grant different permissions
+            self._permissions = None
+        return authenticated
 
     @property
     def permissions(self) -> dict:
-        """Document permissions (print, copy, modify, etc.)."""
-        return {
-            "print": self._doc.permissions & pymupdf.PDF_PERM_PRINT != 0,
-            "copy": self._doc.permissions & pymupdf.PDF_PERM_COPY != 0,
-            "modify": self._doc.permissions & pymupdf.PDF_PERM_MODIFY != 0,
-            "annotate": self._doc.permissions & pymupdf.PDF_PERM_ANNOTATE != 0,
-        }
+        """Document permissions (print, copy, modify, etc.).
+
+        Computed once; permissions only change when authenticate() succeeds.
+        """
+        if self._permissions is None:
+            perms = self._doc.permissions
+            self._permissions = {
+                "print": perms & pymupdf.PDF_PERM_PRINT != 0,
+                "copy": perms & pymupdf.PDF_PERM_COPY != 0,
+                "modify": perms & pymupdf.PDF_PERM_MODIFY != 0,
+                "annotate": perms & pymupdf.PDF_PERM_ANNOTATE != 0,
+            }
+        return self._permissions
 
     def get_page(self, index: int) -> PyMuPDFPage:
-        if index in self._pages:
-            # Move to end (most recently used) for LRU behavior
-            self._pages.move_to_end(index)
-            return self._pages[index]
+        pages = self._pages
+        page = pages.pop(index, None)
+        if page is not None:
+            # Re-insert at the end (most recently used) for LRU behavior
+            pages[index] = page
+            return page
 
         if index < 0 or index >= len(self._doc):
             raise IndexError(f"Page index {index} out of range")
 
         # Evict oldest page if cache is full
-        while len(self._pages) >= self._page_cache_size:
-            oldest_index, oldest_page = self._pages.popitem(last=False)
-            # Clean up temp files for evicted page
-            oldest_page.cleanup_temp_files()
+        self._evict_oldest_pages(len(pages) + 1 - self._page_cache_size)
 
         pdf_page = PyMuPDFPage(self, index)
         self._pages[index] = pdf_page
         return pdf_page
 
+    def _evict_oldest_pages(self, count: int) -> None:
+        """Drop the count least recently used pages from the page cache.
+
+        An evicted page nobody else references is freed with its caches. One
+        a caller still holds is in use (e.g. on screen), so it keeps them.
+        """
+        pages = self._pages
+        for _ in range(min(count, len(pages))):
+            oldest_page = pages.pop(next(iter(pages)))
+            # Clean up temp files for evicted page; most pages never wrote any
+            if oldest_page._has_temp_files:
+                oldest_page.cleanup_temp_files()
+
+    def prefetch_pages(self, indices: Iterable[int]) -> None:
+        """Run page extraction ahead of time so the pages render from cache.
+
+        See PDFBackend.prefetch_pages. New pages enter the page cache as its
+        least recently used entries and at most half the cache is filled per
+        call, so the most recently used pages (the ones on screen) are never
+        evicted. Pages already cached keep their place.
+
+        Args:
+            indices: Page indices to prepare, most likely first
+        """
+        pages = self._pages
+        page_count = len(self._doc)
+        limit = self._page_cache_size // 2
+        new_pages: Dict[int, PyMuPDFPage] = {}
+        prefetch = []
+        for index in indices:
+            if not 0 <= index < page_count or index in new_pages:
+                continue
+            page = pages.get(index)
+            if page is None:
+                if len(new_pages) >= limit:
+                    continue
+                page = new_pages[index] = PyMuPDFPage(self, index)
+            prefetch.append(page)
+
+        if new_pages:
+            self._evict_oldest_pages(len(pages) + len(new_pages) - self._page_cache_size)
+            # Oldest end of the LRU order
+            self._pages = {**new_pages, **self._pages}
+
+        for page in prefetch:
+            page.extract_text_and_chars()
+            page.extract_graphics()
+
     def get_outlines(self) -> List[OutlineItem]:
         outlines = []
-        toc = self._doc.get_toc(simple=False)
-        stack: List[Tuple[int, OutlineItem]] = []
+        # Only level, title and page are used, so skip the per-entry
+        # destination dicts that simple=False would build
+        toc = self._doc.get_toc(simple=True)
+        if not toc:
+            return outlines
 
-        for item in toc:
-            level = item[0]
-            title = item[1]
-            page_num = item[2] - 1 if item[2] > 0 else None
+        # parents[level] is the latest item seen at that level; a new item's
+        # parent is the latest item one level up. get_toc() walks the outline
+        # tree, so levels never jump by more than one between entries.
+        max_level = max(item[0] for item in toc)
+        parents: List[Optional[OutlineItem]] = [None] * (max_level + 1)
+
+        for level, title, page, *_ in toc:
+            page_num = page - 1 if page > 0 else None
 
             outline_item = OutlineItem(
                 title=title,
@@ -2035,15 +3031,13 @@ class PyMuPDFBackend(DocumentBackend):
                 level=level,
             )
 
-            while stack and stack[-1][0] >= level:
-                stack.pop()
-
-            if stack:
-                stack[-1][1].children.append(outline_item)
+            parent = parents[level - 1] if level > 1 else None
+            if parent is not None:
+                parent.children.append(outline_item)
             else:
                 outlines.append(outline_item)
 
-            stack.append((level, outline_item))
+            parents[level] = outline_item
 
         return outlines
 
@@ -2109,7 +3103,21 @@ class PyMuPDFBackend(DocumentBackend):
 
         return destinations
 
-    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+    def save(self, path: Optional[Union[str, Path]] = None, optimize: bool = False) -> None:
+        """Save the document.
+
+        Saving back to the source file appends only the changed objects
+        (incremental save), so annotation edits cost O(new objects) rather
+        than O(document size). Documents opened with preload=True have no
+        file to append to and are rewritten in full. Saving elsewhere writes
+        objects as they are, without garbage collection or re-compression,
+        unless optimize is set.
+
+        Args:
+            path: Target path; defaults to the file the document was opened from
+            optimize: Remove unused objects, compact and deflate streams.
+                Only possible when writing to a new path.
+        """
         if path is None:
             if self._path is None:
                 raise ValueError(
@@ -2117,19 +3125,34 @@ class PyMuPDFBackend(DocumentBackend):
                 )
             path = self._path
 
-        if self._path and Path(path) == self._path:
+        if self._path and not self._preloaded and Path(path) == self._path:
+            if optimize:
+                raise ValueError("optimize requires saving to a new path")
             self._doc.save(str(path), incremental=True, encryption=0)
+        elif optimize:
+            self._doc.save(str(path), garbage=4, clean=True, deflate=True)
         else:
-            self._doc.save(str(path))
+            self._doc.save(str(path), garbage=0, clean=False, deflate=False)
 
     def close(self) -> None:
         # Clean up temp image files from all cached pages
         for page in self._pages.values():
-            page.cleanup_temp_files()
+            if page._has_temp_files:
+                page.cleanup_temp_files()
+
+        # Shared image files are owned by the document, remove each once
+        for path, _, _ in self._raw_image_files.values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._raw_image_files.clear()
 
         if self._doc:
             self._doc.close()
         self._pages.clear()
+        # Its worker threads would otherwise outlive every open document
+        _shutdown_io_pool()
 
         # Cleanup extracted fonts temp directory
         if self._font_temp_dir:
@@ -0,0 +1,20 @@
+"""
+Color conversion helpers shared by the backends, renderer and interactions.
+"""
+
+from __future__ import annotations
+
+from .types import Color
+
+# Two-digit hex string for every byte value, avoids format parsing per color
+BYTE_HEX = [f"{i:02x}" for i in range(256)]
+
+
+def rgb_to_hex(color: Color) -> str:
+    """Convert an RGB tuple (0-1 range) to a "#rrggbb" string."""
+    return (
+        "#"
+        + BYTE_HEX[int(color[0] * 255)]
+        + BYTE_HEX[int(color[1] * 255)]
+        + BYTE_HEX[int(color[2] * 255)]
+    )
@@ -5,12 +5,13 @@ Drawing handler - manages ink/freehand drawing state.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+from ..colors import rgb_to_hex
 from ..types import Color, Path, Point
 
 
-@dataclass
+@dataclass(slots=True)
 class DrawingState:
     """Current drawing state."""
 
@@ -25,6 +26,8 @@ class DrawingHandler:
 
     def __init__(self):
         self._state = DrawingState()
+        # Last (color, hex) pair of get_overlay_color_hex()
+        self._cached_color_hex: Optional[Tuple[Color, str]] = None
 
     @property
     def enabled(self) -> bool:
@@ -65,13 +68,19 @@ class DrawingHandler:
 
     def add_point(self, x: float, y: float, min_distance: float = 5.0) -> None:
         """Add a point to the current stroke if far enough from last point."""
-        if self._state.enabled and self._state.current_path:
-            last_x, last_y = self._state.current_path[-1]
-            dist = ((x - last_x) ** 2 + (y - last_y) ** 2) ** 0.5
-            if dist >= min_distance:
-                self._state.current_path.append((x, y))
-        elif self._state.enabled:
-            self._state.current_path.append((x, y))
+        state = self._state
+        if not state.enabled:
+            return
+        path = state.current_path
+        if path:
+            last_x, last_y = path[-1]
+            # Compare squared distances to skip the square root per event
+            dx = x - last_x
+            dy = y - last_y
+            if dx * dx + dy * dy >= min_distance * min_distance:
+                path.append((x, y))
+        else:
+            path.append((x, y))
 
     def end_stroke(self) -> Path:
         """End the current stroke and return it."""
@@ -89,5 +98,10 @@ class DrawingHandler:
 
     def get_overlay_color_hex(self) -> str:
         """Get the color as hex string for overlay rendering."""
-        r, g, b = self._state.color
-        return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+        color = self._state.color
+        cached = self._cached_color_hex
+        if cached is not None and cached[0] == color:
+            return cached[1]
+        hex_color = rgb_to_hex(color)
+        self._cached_color_hex = (color, hex_color)
+        return hex_color
@@ -4,13 +4,33 @@ Text selection handler - manages selection state and logic.
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Callable, Dict, List, Optional, Tuple
 
 from ..types import Color, Rect, SelectableChar
 
+# Sort key for chars in on-screen x order (runs in C, unlike a lambda)
+_by_abs_x = attrgetter("abs_x")
 
-@dataclass
+
+def _line_key(y: float) -> int:
+    """Line bucket of a y coordinate: y in 10pt bands, rounded half up.
+
+    Plain int arithmetic rather than round(), which is slower and rounds
+    ties to even. Coordinates here are never negative.
+    """
+    return int(y * 0.1 + 0.5)
+
+
+def _text_order(char: SelectableChar) -> Tuple[int, int, float]:
+    """Reading order key: page, then line (page-local y in 10pt bands), then x."""
+    return (char.page_index, _line_key(char.y), char.x)
+
+
+@dataclass(slots=True)
 class SelectionState:
     """Current selection state."""
 
@@ -18,6 +38,11 @@ class SelectionState:
     end: Optional[Tuple[float, float]] = None
     is_selecting: bool = False
     selected_chars: List[SelectableChar] = field(default_factory=list)
+    # Positions of selected_chars in the handler's selectable chars, in the
+    # same order; None once those chars have been replaced
+    selected_indices: Optional[List[int]] = None
+    # Selection rectangle (x1, y1, x2, y2) selected_chars was computed for
+    last_rect: Optional[Rect] = None
 
 
 class SelectionHandler:
@@ -29,6 +54,33 @@ class SelectionHandler:
     ):
         self._state = SelectionState()
         self._selectable_chars: List[SelectableChar] = []
+        # Absolute bounds and line keys of _selectable_chars, one entry per
+        # char, built in set_selectable_chars() rather than on every move
+        self._char_x1 = array("d")
+        self._char_y1 = array("d")
+        self._char_x2 = array("d")
+        self._char_y2 = array("d")
+        self._char_line_keys: List[int] = []
+        # Spatial index: the distinct line keys in ascending order and, for
+        # each line, its char indices and their x1 sorted by x1. A move only
+        # visits the lines and x ranges its rectangle can reach.
+        self._line_keys: List[int] = []
+        self._line_chars: List[List[int]] = []
+        self._line_xs: List[array] = []
+        # Horizontal extent (x1, x2) of each line, keyed by line key
+        self._line_bounds: Dict[int, Tuple[float, float]] = {}
+        # Largest char size, how far a char can reach past its x1/y1
+        self._max_char_width = 0.0
+        self._max_char_height = 0.0
+        # _text_order() of each selectable char, for sorting selections
+        self._text_keys: List[Tuple[int, int, float]] = []
+        # Last results of get_highlight_rects()/get_annotation_rects(), keyed
+        # on the selected_chars list they were built from. Every change of
+        # selection assigns a new list, so an identity check is enough.
+        self._highlight_cache: Optional[Tuple[List[SelectableChar], List[Rect]]] = None
+        self._annotation_cache: Optional[
+            Tuple[List[SelectableChar], float, Dict[int, List[Rect]]]
+        ] = None
         self._on_selection_change = on_selection_change
 
     @property
@@ -47,10 +99,15 @@ class SelectionHandler:
         if not self._state.selected_chars:
             return ""
 
-        sorted_chars = sorted(
-            self._state.selected_chars,
-            key=lambda c: (c.page_index, round(c.y / 10), c.x),
-        )
+        indices = self._state.selected_indices
+        if indices is not None:
+            # Sort positions by the keys computed at load time, so no key is
+            # rebuilt per char on every call
+            chars = self._selectable_chars
+            order = sorted(indices, key=self._text_keys.__getitem__)
+            sorted_chars = [chars[i] for i in order]
+        else:
+            sorted_chars = sorted(self._state.selected_chars, key=_text_order)
 
         result = []
         current_line = []
@@ -85,6 +142,40 @@ class SelectionHandler:
     def set_selectable_chars(self, chars: List[SelectableChar]) -> None:
         """Update the list of selectable characters."""
         self._selectable_chars = chars
+        # Offsets are final by now; resolve them once so highlight and
+        # annotation code reads attributes instead of redoing the math
+        for c in chars:
+            c.abs_x = c.x + c.page_offset_x
+            c.abs_y = y = c.y + c.page_offset_y
+            c.y_key = _line_key(y)
+
+        self._char_x1 = xs = array("d", [c.abs_x for c in chars])
+        self._char_y1 = ys = array("d", [c.abs_y for c in chars])
+        self._char_x2 = x2s = array("d", [x + c.width for x, c in zip(xs, chars)])
+        self._char_y2 = array("d", [y + c.height for y, c in zip(ys, chars)])
+        self._char_line_keys = line_keys = [c.y_key for c in chars]
+        self._text_keys = [_text_order(c) for c in chars]
+        # Any current selection points into the old list
+        self._state.selected_indices = None
+        self._state.last_rect = None
+        # Highlight rects extend to line bounds of the old chars
+        self._highlight_cache = None
+
+        lines: Dict[int, List[int]] = {}
+        for i, y_key in enumerate(line_keys):
+            if y_key not in lines:
+                lines[y_key] = []
+            lines[y_key].append(i)
+        self._line_keys = sorted(lines)
+        self._line_chars = [sorted(lines[y_key], key=xs.__getitem__) for y_key in self._line_keys]
+        self._line_xs = [array("d", [xs[i] for i in line]) for line in self._line_chars]
+        # Lines are x1-sorted, so the start is the first x1
+        self._line_bounds = {
+            y_key: (line_xs[0], max(x2s[i] for i in line))
+            for y_key, line, line_xs in zip(self._line_keys, self._line_chars, self._line_xs)
+        }
+        self._max_char_width = max((c.width for c in chars), default=0.0)
+        self._max_char_height = max((c.height for c in chars), default=0.0)
 
     def start_selection(self, x: float, y: float) -> None:
         """Start a new selection."""
@@ -95,13 +186,18 @@ class SelectionHandler:
             selected_chars=[],
         )
 
-    def update_selection(self, x: float, y: float) -> None:
-        """Update selection end point."""
+    def update_selection(self, x: float, y: float) -> bool:
+        """Update selection end point.
+
+        Returns:
+            Whether the selected characters changed, i.e. whether the
+            highlight needs to be redrawn
+        """
         if not self._state.is_selecting:
-            return
+            return False
 
         self._state.end = (x, y)
-        self._update_selected_chars()
+        return self._update_selected_chars()
 
     def end_selection(self) -> None:
         """End the current selection."""
@@ -113,169 +209,177 @@ class SelectionHandler:
         """Clear the current selection."""
         self._state = SelectionState()
 
-    def _update_selected_chars(self) -> None:
-        """Update selected characters based on selection rectangle."""
-        if not self._state.start or not self._state.end:
-            return
-
-        x1 = min(self._state.start[0], self._state.end[0])
-        y1 = min(self._state.start[1], self._state.end[1])
-        x2 = max(self._state.start[0], self._state.end[0])
-        y2 = max(self._state.start[1], self._state.end[1])
+    def _update_selected_chars(self) -> bool:
+        """Update selected characters based on selection rectangle.
+
+        Returns:
+            Whether the selected characters changed
+        """
+        state = self._state
+        if not state.start or not state.end:
+            return False
+
+        x1 = min(state.start[0], state.end[0])
+        y1 = min(state.start[1], state.end[1])
+        x2 = max(state.start[0], state.end[0])
+        y2 = max(state.start[1], state.end[1])
+
+        # Drag events often repeat the previous position
+        rect = (x1, y1, x2, y2)
+        if rect == state.last_rect:
+            return False
+        state.last_rect = rect
+
+        selected = self._chars_in_rect(x1, y1, x2, y2)
+        if selected == state.selected_indices:
+            return False
+        chars = self._selectable_chars
+        state.selected_chars = [chars[i] for i in selected]
+        state.selected_indices = selected
+        return True
+
+    def _chars_in_rect(self, x1: float, y1: float, x2: float, y2: float) -> List[int]:
+        """Find the selectable chars a selection rectangle covers.
+
+        Chars the rectangle touches are selected directly. When they span
+        several lines, the selection extends to the line edges in between,
+        like text selection in a document.
+
+        Returns:
+            Sorted indices into the selectable chars
+        """
+        # A click, or a drag that hasn't left the press point, selects nothing
+        if x2 - x1 < 0.5 and y2 - y1 < 0.5:
+            return []
 
-        # Find directly intersecting characters
+        char_x1 = self._char_x1
+        char_y1 = self._char_y1
+        char_x2 = self._char_x2
+        char_y2 = self._char_y2
+        line_keys = self._char_line_keys
+        sorted_keys = self._line_keys
+        line_chars = self._line_chars
+        line_xs = self._line_xs
+
+        # Find directly intersecting characters, as indices into chars. A char
+        # can only reach the rectangle if its y1 lies within the largest char
+        # height above it and its x1 within the largest width left of it, so
+        # only those lines and x ranges are tested (with 1pt of slack for
+        # rounding). Line keys are monotonic in y1, so the lines form a slice.
+        x_from = x1 - self._max_char_width - 1
         directly_selected = []
-        for char in self._selectable_chars:
-            char_x1 = char.x + char.page_offset_x
-            char_y1 = char.y + char.page_offset_y
-            char_x2 = char_x1 + char.width
-            char_y2 = char_y1 + char.height
-
-            if self._rects_intersect(
-                x1, y1, x2, y2, char_x1, char_y1, char_x2, char_y2
-            ):
-                directly_selected.append(char)
+        for line in range(
+            bisect_left(sorted_keys, _line_key(y1 - self._max_char_height - 1)),
+            bisect_right(sorted_keys, _line_key(y2 + 1)),
+        ):
+            xs = line_xs[line]
+            indices = line_chars[line]
+            for i in indices[bisect_right(xs, x_from) : bisect_left(xs, x2)]:
+                # Rectangle intersection, inlined: this runs per candidate
+                if x1 < char_x2[i] and x2 > char_x1[i] and y1 < char_y2[i] and y2 > char_y1[i]:
+                    directly_selected.append(i)
 
         if not directly_selected:
-            self._state.selected_chars = []
-            return
-
-        # Group by line
-        lines: Dict[int, List[SelectableChar]] = {}
-        for char in directly_selected:
-            y_key = round((char.y + char.page_offset_y) / 10)
-            if y_key not in lines:
-                lines[y_key] = []
-            lines[y_key].append(char)
-
-        # Single line - no extension
-        if len(lines) <= 1:
-            self._state.selected_chars = directly_selected
-            return
+            return directly_selected
+
+        # Lines were visited in ascending key order and each line's chars in
+        # x1 order, so the first and last hits are the leftmost char of the
+        # first line and the rightmost of the last; no grouping needed.
+        first = directly_selected[0]
+        last = directly_selected[-1]
+        first_line_key = line_keys[first]
+        last_line_key = line_keys[last]
+
+        # Single line - no extension. Selections keep the order of
+        # _selectable_chars, whatever order the index visited them in.
+        if first_line_key == last_line_key:
+            directly_selected.sort()
+            return directly_selected
 
         # Multiple lines - extend to line edges
-        sorted_line_keys = sorted(lines.keys())
-        first_line_key = sorted_line_keys[0]
-        last_line_key = sorted_line_keys[-1]
-
-        first_line_chars = sorted(
-            lines[first_line_key], key=lambda c: c.x + c.page_offset_x
-        )
-        first_selected_x = first_line_chars[0].x + first_line_chars[0].page_offset_x
-
-        last_line_chars = sorted(
-            lines[last_line_key], key=lambda c: c.x + c.page_offset_x
-        )
-        last_selected_x = (
-            last_line_chars[-1].x
-            + last_line_chars[-1].page_offset_x
-            + last_line_chars[-1].width
-        )
-
-        # Build extended selection
-        self._state.selected_chars = []
-        for char in self._selectable_chars:
-            char_x1 = char.x + char.page_offset_x
-            char_y1 = char.y + char.page_offset_y
-            char_y_key = round(char_y1 / 10)
-
-            if char_y_key < first_line_key or char_y_key > last_line_key:
-                continue
-
-            if char_y_key == first_line_key:
-                if char_x1 >= first_selected_x - 1:
-                    self._state.selected_chars.append(char)
-            elif char_y_key == last_line_key:
-                char_x2 = char_x1 + char.width
-                if char_x2 <= last_selected_x + 1:
-                    self._state.selected_chars.append(char)
-            else:
-                self._state.selected_chars.append(char)
-
-    def _rects_intersect(
-        self,
-        ax1: float,
-        ay1: float,
-        ax2: float,
-        ay2: float,
-        bx1: float,
-        by1: float,
-        bx2: float,
-        by2: float,
-    ) -> bool:
-        """Check if two rectangles intersect."""
-        return ax1 < bx2 and ax2 > bx1 and ay1 < by2 and ay2 > by1
+        first_selected_x = char_x1[first]
+        last_selected_x = char_x2[last]
+
+        # Build extended selection from the lines in between: the first line
+        # from the selection start on, the last one up to the selection end,
+        # every line in between whole
+        first_line = bisect_left(sorted_keys, first_line_key)
+        last_line = bisect_left(sorted_keys, last_line_key)
+        selected = line_chars[first_line][
+            bisect_left(line_xs[first_line], first_selected_x - 1) :
+        ]
+        for line in range(first_line + 1, last_line):
+            selected.extend(line_chars[line])
+        selected.extend(i for i in line_chars[last_line] if char_x2[i] <= last_selected_x + 1)
+        selected.sort()
+        return selected
 
     def get_highlight_rects(self) -> List[Rect]:
-        """Get rectangles for visual highlight."""
+        """Get rectangles for visual highlight.
+
+        The result is reused until the selection changes; don't modify it.
+        """
         chars = self._state.selected_chars
+        cached = self._highlight_cache
+        if cached is not None and cached[0] is chars:
+            return cached[1]
+        rects = self._build_highlight_rects(chars)
+        self._highlight_cache = (chars, rects)
+        return rects
+
+    def _build_highlight_rects(self, chars: List[SelectableChar]) -> List[Rect]:
+        """Compute highlight rectangles, one per selected line."""
         if not chars:
             return []
 
         # Group by line
         lines: Dict[int, List[SelectableChar]] = {}
         for char in chars:
-            y_key = round((char.y + char.page_offset_y) / 10)
+            y_key = char.y_key
             if y_key not in lines:
                 lines[y_key] = []
             lines[y_key].append(char)
 
         if len(lines) <= 1:
-            sorted_chars = sorted(chars, key=lambda c: c.x + c.page_offset_x)
+            sorted_chars = sorted(chars, key=_by_abs_x)
             if not sorted_chars:
                 return []
 
             first = sorted_chars[0]
             last = sorted_chars[-1]
 
-            x1 = first.x + first.page_offset_x
-            x2 = last.x + last.page_offset_x + last.width
-            y1 = min(c.y + c.page_offset_y for c in sorted_chars)
-            y2 = max(c.y + c.page_offset_y + c.height for c in sorted_chars)
+            x1 = first.abs_x
+            x2 = last.abs_x + last.width
+            y1 = min(c.abs_y for c in sorted_chars)
+            y2 = max(c.abs_y + c.height for c in sorted_chars)
 
             return [(x1, y1, x2, y2)]
 
-        # Multiple lines - compute line bounds
+        # Multiple lines - line bounds are precomputed per page load
         sorted_line_keys = sorted(lines.keys())
-        line_bounds: Dict[int, Tuple[float, float]] = {}
-
-        for char in self._selectable_chars:
-            y_key = round((char.y + char.page_offset_y) / 10)
-            char_x1 = char.x + char.page_offset_x
-            char_x2 = char_x1 + char.width
-            if y_key not in line_bounds:
-                line_bounds[y_key] = (char_x1, char_x2)
-            else:
-                line_bounds[y_key] = (
-                    min(line_bounds[y_key][0], char_x1),
-                    max(line_bounds[y_key][1], char_x2),
-                )
+        line_bounds = self._line_bounds
 
         rects = []
         for i, y_key in enumerate(sorted_line_keys):
-            line_chars = sorted(lines[y_key], key=lambda c: c.x + c.page_offset_x)
+            line_chars = sorted(lines[y_key], key=_by_abs_x)
             if not line_chars:
                 continue
 
             first_char = line_chars[0]
             last_char = line_chars[-1]
 
-            y1 = min(c.y + c.page_offset_y for c in line_chars)
-            y2 = max(c.y + c.page_offset_y + c.height for c in line_chars)
+            y1 = min(c.abs_y for c in line_chars)
+            y2 = max(c.abs_y + c.height for c in line_chars)
 
-            line_start = line_bounds.get(
-                y_key, (first_char.x + first_char.page_offset_x, 0)
-            )[0]
-            line_end = line_bounds.get(
-                y_key, (0, last_char.x + last_char.page_offset_x + last_char.width)
-            )[1]
+            line_start = line_bounds.get(y_key, (first_char.abs_x, 0))[0]
+            line_end = line_bounds.get(y_key, (0, last_char.abs_x + last_char.width))[1]
 
             if i == 0:
-                x1 = first_char.x + first_char.page_offset_x
+                x1 = first_char.abs_x
                 x2 = line_end
             elif i == len(sorted_line_keys) - 1:
                 x1 = line_start
-                x2 = last_char.x + last_char.page_offset_x + last_char.width
+                x2 = last_char.abs_x + last_char.width
             else:
                 x1 = line_start
                 x2 = line_end
@@ -285,13 +389,30 @@ class SelectionHandler:
         return rects
 
     def get_annotation_rects(self, scale: float) -> Dict[int, List[Rect]]:
-        """Get rectangles for annotations, grouped by page, in PDF coordinates."""
+        """Get rectangles for annotations, grouped by page, in PDF coordinates.
+
+        The result is reused until the selection or scale changes; don't
+        modify it.
+        """
         chars = self._state.selected_chars
+        cached = self._annotation_cache
+        if cached is not None and cached[0] is chars and cached[1] == scale:
+            return cached[2]
         if not chars:
             return {}
 
+        # Put chars in reading order once, using the keys computed at load
+        # time when the selection still points into the selectable chars
+        indices = self._state.selected_indices
+        if indices is not None:
+            selectable = self._selectable_chars
+            order = sorted(indices, key=self._text_keys.__getitem__)
+            ordered = [selectable[i] for i in order]
+        else:
+            ordered = sorted(chars, key=_text_order)
+
         chars_by_page: Dict[int, List[SelectableChar]] = {}
-        for char in chars:
+        for char in ordered:
             if char.page_index not in chars_by_page:
                 chars_by_page[char.page_index] = []
             chars_by_page[char.page_index].append(char)
@@ -300,42 +421,47 @@ class SelectionHandler:
         for page_index, page_chars in chars_by_page.items():
             result[page_index] = self._merge_char_rects(page_chars, scale)
 
+        self._annotation_cache = (chars, scale, result)
         return result
 
     def _merge_char_rects(
         self, chars: List[SelectableChar], scale: float
     ) -> List[Rect]:
-        """Merge adjacent characters into continuous rectangles."""
+        """Merge adjacent characters into continuous rectangles.
+
+        Args:
+            chars: Characters of one page, in reading order
+            scale: Scale to divide positions by
+        """
         if not chars:
             return []
 
-        sorted_chars = sorted(chars, key=lambda c: (round(c.y / 10), c.x))
-
+        # Each run is tracked as four floats in page coordinates and only
+        # scaled when it is closed; division is monotonic, so scaling the
+        # run's min/max equals taking min/max of scaled char rects
         rects = []
-        current_rect = None
-        last_y = None
-
-        for char in sorted_chars:
-            char_rect = (
-                char.x / scale,
-                char.y / scale,
-                (char.x + char.width) / scale,
-                (char.y + char.height) / scale,
-            )
-
-            if current_rect is None:
-                current_rect = list(char_rect)
-                last_y = char.y
-            elif abs(char.y - last_y) < char.height * 0.5:
-                current_rect[2] = char_rect[2]
-                current_rect[1] = min(current_rect[1], char_rect[1])
-                current_rect[3] = max(current_rect[3], char_rect[3])
+        first = chars[0]
+        last_y = first.y
+        run_x1 = first.x
+        run_y1 = first.y
+        run_x2 = first.x + first.width
+        run_y2 = first.y + first.height
+
+        for char in chars[1:]:
+            y = char.y
+            if abs(y - last_y) < char.height * 0.5:
+                run_x2 = char.x + char.width
+                if y < run_y1:
+                    run_y1 = y
+                if y + char.height > run_y2:
+                    run_y2 = y + char.height
             else:
-                rects.append(tuple(current_rect))
-                current_rect = list(char_rect)
-                last_y = char.y
-
-        if current_rect:
-            rects.append(tuple(current_rect))
-
+                rects.append((run_x1 / scale, run_y1 / scale, run_x2 / scale, run_y2 / scale))
+                last_y = y
+                run_x1 = char.x
+                run_y1 = y
+                run_x2 = char.x + char.width
+                run_y2 = y + char.height
+
+        rects.append((run_x1 / scale, run_y1 / scale, run_x2 / scale, run_y2 / scale))
         return rects
@@ -7,10 +7,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
+from ..colors import rgb_to_hex
 from ..types import Color, ShapeType
 
 
-@dataclass
+@dataclass(slots=True)
 class ShapeDrawingState:
     """Current shape drawing state."""
 
@@ -31,6 +32,10 @@ class ShapeDrawingHandler:
 
     def __init__(self):
         self._state = ShapeDrawingState()
+        # Last (color, hex) pairs of the hex getters; the overlay asks for
+        # them on every move while the colors only change in enable()
+        self._cached_stroke_hex: Optional[Tuple[Color, str]] = None
+        self._cached_fill_hex: Optional[Tuple[Color, str]] = None
 
     @property
     def enabled(self) -> bool:
@@ -188,12 +193,22 @@ class ShapeDrawingHandler:
 
     def get_stroke_color_hex(self) -> str:
         """Get the stroke color as hex string for overlay rendering."""
-        r, g, b = self._state.stroke_color
-        return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+        color = self._state.stroke_color
+        cached = self._cached_stroke_hex
+        if cached is not None and cached[0] == color:
+            return cached[1]
+        hex_color = rgb_to_hex(color)
+        self._cached_stroke_hex = (color, hex_color)
+        return hex_color
 
     def get_fill_color_hex(self) -> Optional[str]:
         """Get the fill color as hex string for overlay rendering."""
-        if self._state.fill_color is None:
+        color = self._state.fill_color
+        if color is None:
             return None
-        r, g, b = self._state.fill_color
-        return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+        cached = self._cached_fill_hex
+        if cached is not None and cached[0] == color:
+            return cached[1]
+        hex_color = rgb_to_hex(color)
+        self._cached_fill_hex = (color, hex_color)
+        return hex_color
@@ -9,11 +9,23 @@ from typing import Any, List, Tuple
 
 import flet as ft
 import flet.canvas as cv
-import pymupdf
 
 from ..backends.base import PageBackend
+from ..colors import rgb_to_hex
 from ..types import AnnotationInfo, LinearGradient, RadialGradient, RenderResult, SelectableChar
 
+# MuPDF annotation type numbers (pymupdf.PDF_ANNOT_*), spelled out so the
+# renderer doesn't import PyMuPDF itself
+_ANNOT_TEXT = 0
+_ANNOT_HIGHLIGHT = 8
+_ANNOT_UNDERLINE = 9
+_ANNOT_SQUIGGLY = 10
+_ANNOT_STRIKE_OUT = 11
+_ANNOT_INK = 15
+_TEXT_MARKUP_TYPES = frozenset(
+    (_ANNOT_HIGHLIGHT, _ANNOT_UNDERLINE, _ANNOT_SQUIGGLY, _ANNOT_STRIKE_OUT)
+)
+
 
 def _get_font_family(pdf_font: str, flags: int = 0) -> str:
     """Get font family name for Flet.
@@ -79,7 +91,7 @@ class PageRenderer:
             if gfx.type == "rect" and width > 0 and height > 0:
                 self._render_rect(gfx, cx0, cy0, width, height, shapes)
 
-            elif gfx.type == "path" and gfx.path_commands:
+            elif gfx.type == "path" and (gfx.path_ops or gfx.path_commands):
                 self._render_path(gfx, shapes)
 
     def _render_rect(
@@ -142,7 +154,13 @@ class PageRenderer:
         """Render a path with lines and bezier curves."""
         path_elements = []
 
-        for cmd in gfx.path_commands:
+        if gfx.path_ops is not None:
+            self._build_flat_path(gfx.path_ops, gfx.path_coords, path_elements)
+            commands = ()
+        else:
+            commands = gfx.path_commands
+
+        for cmd in commands:
             op = cmd[0]
 
             if op == "m":  # MoveTo
@@ -195,6 +213,33 @@ class PageRenderer:
                 )
             )
 
+    def _build_flat_path(self, ops: str, coords: Any, path_elements: List[Any]) -> None:
+        """Build path elements from flat opcodes and packed coordinates."""
+        scale = self.scale
+        append = path_elements.append
+        i = 0
+
+        for op in ops:
+            if op == "m":  # MoveTo
+                append(cv.Path.MoveTo(coords[i] * scale, coords[i + 1] * scale))
+                i += 2
+
+            elif op == "l":  # LineTo
+                append(cv.Path.LineTo(coords[i] * scale, coords[i + 1] * scale))
+                i += 2
+
+            elif op == "c":  # Cubic bezier
+                x1, y1, x2, y2, x3, y3 = coords[i : i + 6]
+                append(
+                    cv.Path.CubicTo(
+                        x1 * scale, y1 * scale, x2 * scale, y2 * scale, x3 * scale, y3 * scale
+                    )
+                )
+                i += 6
+
+            elif op == "h":  # Close path
+                append(cv.Path.Close())
+
     def _render_images(
         self, page: PageBackend, images: List[Tuple[str, float, float, float, float]]
     ) -> None:
@@ -219,24 +264,67 @@ class PageRenderer:
 
     def _render_annotation(self, annot: AnnotationInfo, shapes: List[Any]) -> None:
         """Render a single annotation."""
-        cx0 = annot.rect[0] * self.scale
-        cy0 = annot.rect[1] * self.scale
-        cx1 = annot.rect[2] * self.scale
-        cy1 = annot.rect[3] * self.scale
-        width = cx1 - cx0
-        height = cy1 - cy0
+        hex_color = rgb_to_hex(annot.color)
+
+        # Text markup: one shape per marked-up line
+        if annot.type in _TEXT_MARKUP_TYPES:
+            for box in self._markup_boxes(annot):
+                self._render_markup_box(annot.type, box, hex_color, shapes)
+
+        # Text note (sticky note)
+        elif annot.type == _ANNOT_TEXT:
+            self._render_note_icon(
+                annot.rect[0] * self.scale, annot.rect[1] * self.scale, hex_color, shapes
+            )
+
+        # Ink (freehand)
+        elif annot.type == _ANNOT_INK:
+            self._render_ink(annot, hex_color, shapes)
 
-        r, g, b = annot.color
-        hex_color = f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+    def _markup_boxes(self, annot: AnnotationInfo) -> List[Tuple[float, float, float, float]]:
+        """Get the scaled boxes a text markup annotation covers.
+
+        A markup annotation over several lines stores one quad per line in
+        its vertices (4 points each); its rect is the bounding box of all of
+        them. Falls back to the rect when there are no vertices.
+
+        Returns:
+            List of (x0, y0, x1, y1) boxes in canvas coordinates
+        """
+        scale = self.scale
+        vertices = annot.vertices
+        if not vertices or len(vertices) < 4:
+            x0, y0, x1, y1 = annot.rect
+            return [(x0 * scale, y0 * scale, x1 * scale, y1 * scale)]
+
+        boxes = []
+        for i in range(0, len(vertices) - 3, 4):
+            quad = vertices[i : i + 4]
+            xs = [p[0] for p in quad]
+            ys = [p[1] for p in quad]
+            boxes.append(
+                (min(xs) * scale, min(ys) * scale, max(xs) * scale, max(ys) * scale)
+            )
+        return boxes
+
+    def _render_markup_box(
+        self,
+        annot_type: int,
+        box: Tuple[float, float, float, float],
+        hex_color: str,
+        shapes: List[Any],
+    ) -> None:
+        """Render one line of a text markup annotation."""
+        cx0, cy0, cx1, cy1 = box
 
         # Highlight
-        if annot.type == pymupdf.PDF_ANNOT_HIGHLIGHT:
+        if annot_type == _ANNOT_HIGHLIGHT:
             shapes.append(
                 cv.Rect(
                     x=cx0,
                     y=cy0,
-                    width=width,
-                    height=height,
+                    width=cx1 - cx0,
+                    height=cy1 - cy0,
                     paint=ft.Paint(
                         color=ft.Colors.with_opacity(0.35, hex_color),
                         style=ft.PaintingStyle.FILL,
@@ -245,7 +333,7 @@ class PageRenderer:
             )
 
         # Underline
-        elif annot.type == pymupdf.PDF_ANNOT_UNDERLINE:
+        elif annot_type == _ANNOT_UNDERLINE:
             shapes.append(
                 cv.Line(
                     x1=cx0,
@@ -260,8 +348,8 @@ class PageRenderer:
             )
 
         # Strikethrough
-        elif annot.type == pymupdf.PDF_ANNOT_STRIKE_OUT:
-            mid_y = cy0 + height / 2
+        elif annot_type == _ANNOT_STRIKE_OUT:
+            mid_y = cy0 + (cy1 - cy0) / 2
             shapes.append(
                 cv.Line(
                     x1=cx0,
@@ -276,17 +364,9 @@ class PageRenderer:
             )
 
         # Squiggly
-        elif annot.type == pymupdf.PDF_ANNOT_SQUIGGLY:
+        elif annot_type == _ANNOT_SQUIGGLY:
             self._render_squiggly(cx0, cx1, cy1, hex_color, shapes)
 
-        # Text note (sticky note)
-        elif annot.type == pymupdf.PDF_ANNOT_TEXT:
-            self._render_note_icon(cx0, cy0, hex_color, shapes)
-
-        # Ink (freehand)
-        elif annot.type == pymupdf.PDF_ANNOT_INK:
-            self._render_ink(annot, hex_color, shapes)
-
     def _render_squiggly(
         self, x0: float, x1: float, y: float, color: str, shapes: List[Any]
     ) -> None:
@@ -425,7 +505,9 @@ class PageRenderer:
 
     def _render_text(self, page: PageBackend, shapes: List[Any]) -> None:
         """Render text blocks."""
-        for block in page.extract_text_blocks():
+        # Chars are extracted for selection right after; build both in one pass
+        blocks, _ = page.extract_text_and_chars()
+        for block in blocks:
             canvas_x = block.x * self.scale
             canvas_y = block.y * self.scale
             font_size = block.font_size * self.scale
@@ -467,10 +549,7 @@ class PageRenderer:
         """Convert gradient definition to Flet Paint with gradient."""
         try:
             # Convert RGB tuples (0-1) to hex colors
-            colors = []
-            for c in gradient.colors:
-                r, g, b = int(c[0] * 255), int(c[1] * 255), int(c[2] * 255)
-                colors.append(f"#{r:02x}{g:02x}{b:02x}")
+            colors = [rgb_to_hex(c) for c in gradient.colors]
 
             if isinstance(gradient, LinearGradient):
                 # Handle extend properties
@@ -537,16 +616,20 @@ class PageRenderer:
     ) -> List[SelectableChar]:
         """Build selectable characters from a page."""
         chars = page.extract_chars()
+        scale = self.scale
+        # One per character on the page: positional arguments skip keyword
+        # matching. SelectableChar(char, x, y, width, height, page_index,
+        # page_offset_x, page_offset_y)
         return [
             SelectableChar(
-                char=c.char,
-                x=c.x * self.scale,
-                y=c.y * self.scale,
-                width=c.width * self.scale,
-                height=c.height * self.scale,
-                page_index=page_index,
-                page_offset_x=offset_x,
-                page_offset_y=offset_y,
+                c.char,
+                c.x * scale,
+                c.y * scale,
+                c.width * scale,
+                c.height * scale,
+                page_index,
+                offset_x,
+                offset_y,
             )
             for c in chars
         ]
@@ -2,9 +2,10 @@
 Shared data types for the PDF viewer.
 """
 
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import InitVar, dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Tuple
 
 if TYPE_CHECKING:
     import flet as ft
@@ -28,7 +29,11 @@ class PageInfo:
     rotation: int = 0
 
 
-@dataclass
+# Number of coordinates each path opcode consumes from GraphicsInfo.path_coords
+_PATH_OP_COORDS = {"m": 2, "l": 2, "c": 6, "h": 0}
+
+
+@dataclass(slots=True)
 class TextBlock:
     """Extracted text with position."""
 
@@ -47,7 +52,7 @@ class TextBlock:
     font_flags: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CharInfo:
     """Single character with position info."""
 
@@ -61,7 +66,7 @@ class CharInfo:
     color: str = "#000000"
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectableChar:
     """A character with scaled position for selection."""
 
@@ -73,6 +78,11 @@ class SelectableChar:
     page_index: int
     page_offset_x: float = 0
     page_offset_y: float = 0
+    # Position including the page offset, and the line key (abs_y in 10pt bands);
+    # filled in by SelectionHandler.set_selectable_chars() once offsets are set
+    abs_x: float = 0
+    abs_y: float = 0
+    y_key: int = 0
 
 
 @dataclass
@@ -104,7 +114,7 @@ class TocItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInfo:
     """An extracted image."""
 
@@ -112,9 +122,11 @@ class ImageInfo:
     width: int
     height: int
     png_path: Optional[str] = None
+    # Encoded image data, only set by extract_images(write_files=False)
+    image_bytes: Optional[bytes] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphicsInfo:
     """A graphics element (rect, line, path, circle, curve)."""
 
@@ -123,12 +135,19 @@ class GraphicsInfo:
     linewidth: float = 0
     stroke_color: Optional[str] = None
     fill_color: Optional[str] = None
-    # For lines: (x1, y1, x2, y2)
+    # For lines: (x1, y1, x2, y2); for paths: every point the path visits
     points: Optional[List[Tuple[float, float]]] = None
     # For paths: list of path commands
     # Each command is a tuple: ("m", x, y) for moveto, ("l", x, y) for lineto,
     # ("c", x1, y1, x2, y2, x3, y3) for cubic bezier, ("h",) for close
-    path_commands: Optional[List[Tuple]] = None
+    # The PyMuPDF backend fills the flat form below instead; the
+    # path_commands property then builds the list from it on each access, so
+    # prefer iter_path_commands() in loops.
+    path_commands: InitVar[Optional[List[Tuple]]] = None
+    # Flat form of path_commands: one opcode per command ("m", "l", "c", "h")
+    # with their coordinates packed back to back in path_coords
+    path_ops: Optional[str] = None
+    path_coords: Optional[array] = None
     # For circles/ellipses
     center: Optional[Tuple[float, float]] = None
     radius: Optional[Tuple[float, float]] = None  # (rx, ry) for ellipse
@@ -136,6 +155,45 @@ class GraphicsInfo:
     fill_gradient: Optional["LinearGradient | RadialGradient"] = None
     # For dashed strokes: [dash_length, gap_length, ...] or None for solid
     stroke_dashes: Optional[List[float]] = None
+    # Storage behind the path_commands property
+    _path_commands: Optional[List[Tuple]] = field(default=None, init=False)
+
+    def __post_init__(self, path_commands: Optional[List[Tuple]]) -> None:
+        self._path_commands = path_commands
+
+    def iter_path_commands(self) -> Iterator[Tuple]:
+        """Iterate path commands as tuples, whichever form they are stored in."""
+        if self.path_ops is None:
+            yield from self._path_commands or ()
+            return
+
+        coords = self.path_coords
+        i = 0
+        for op in self.path_ops:
+            n = _PATH_OP_COORDS[op]
+            yield (op, *coords[i : i + n])
+            i += n
+
+
+def _get_path_commands(self: GraphicsInfo) -> Optional[List[Tuple]]:
+    if self.path_ops is None:
+        return self._path_commands
+    return list(self.iter_path_commands())
+
+
+def _set_path_commands(self: GraphicsInfo, value: Optional[List[Tuple]]) -> None:
+    self._path_commands = value
+    self.path_ops = None
+    self.path_coords = None
+
+
+# Assigned after the class body: a property there would become the InitVar's
+# default value
+GraphicsInfo.path_commands = property(  # type: ignore[assignment]
+    _get_path_commands,
+    _set_path_commands,
+    doc="Path commands as a list of tuples, built from the flat form if needed.",
+)
 
 
 @dataclass
@@ -151,7 +209,7 @@ class AnnotationInfo:
     border_width: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkInfo:
     """A PDF link (clickable area)."""
 
@@ -227,7 +285,7 @@ class ShapeType(Enum):
     TEXT = "text"
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A single search match in the document."""
 
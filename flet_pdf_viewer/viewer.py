@@ -896,8 +896,9 @@ class PdfViewer:
             self._shape_drawing.update_shape(e.local_x, e.local_y)
             self._update_shape_overlay()
         else:
-            self._selection.update_selection(e.local_x, e.local_y)
-            self._update_selection_overlay()
+            # Only redraw the highlight when the selected chars changed
+            if self._selection.update_selection(e.local_x, e.local_y):
+                self._update_selection_overlay()
 
     def _on_pan_end(self, e: ft.DragEndEvent):
         if self._drawing.enabled:
@@ -0,0 +1,55 @@
+"""
+Tests for PyMuPDFBackend's page cache eviction and prefetching.
+"""
+
+import pytest
+
+pymupdf = pytest.importorskip("pymupdf")
+pytest.importorskip("flet")
+
+from flet_pdf_viewer.backends.pymupdf import PyMuPDFBackend  # noqa: E402
+
+
+@pytest.fixture
+def backend():
+    doc = pymupdf.open()
+    for i in range(10):
+        doc.new_page().insert_text((72, 100), f"page {i}")
+    data = doc.tobytes()
+    doc.close()
+    backend = PyMuPDFBackend(data, page_cache_size=4)
+    yield backend
+    backend.close()
+
+
+def test_evicted_page_keeps_caches_while_held(backend):
+    page = backend.get_page(0)
+    page.extract_text_and_chars()
+    for index in range(1, 10):
+        backend.get_page(index)
+    assert 0 not in backend._pages
+    # Still held by the caller, so still usable without re-extracting
+    assert page._cached_chars is not None
+    assert page._cached_text_blocks is not None
+
+
+def test_prefetch_keeps_current_pages(backend):
+    current = [backend.get_page(0), backend.get_page(1)]
+    for page in current:
+        page.extract_text_and_chars()
+
+    backend.prefetch_pages(range(2, 10))
+
+    for index, page in enumerate(current):
+        assert backend.get_page(index) is page
+        assert page._cached_chars is not None
+    # Half the cache was filled, with the pages asked for first
+    assert sorted(backend._pages) == [0, 1, 2, 3]
+    assert backend._pages[2]._cached_chars is not None
+
+
+def test_prefetch_displaces_least_recently_used(backend):
+    for index in (5, 6, 0, 1):
+        backend.get_page(index)
+    backend.prefetch_pages([2, 3])
+    assert sorted(backend._pages) == [0, 1, 2, 3]
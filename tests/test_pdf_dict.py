@@ -0,0 +1,76 @@
+"""
+Tests for the PDF object parser used for patterns, shadings and functions.
+"""
+
+import pytest
+
+pytest.importorskip("pymupdf")
+pytest.importorskip("flet")
+
+from flet_pdf_viewer.backends.pymupdf import _parse_pdf_dict, _pdf_value  # noqa: E402
+
+
+def _value(s):
+    value, end = _pdf_value(s, 0, len(s))
+    return value, end
+
+
+def test_scalars():
+    assert _value("/DeviceRGB") == ("DeviceRGB", 10)
+    assert _value("  42 ") == (42, 4)
+    assert _value("-1.5") == (-1.5, 4)
+    assert _value("true") == (True, 4)
+    assert _value("false") == (False, 5)
+    assert _value("null") == (None, 4)
+
+
+def test_nested_dicts_and_arrays():
+    parsed = _parse_pdf_dict(
+        "<<\n  /Type /Pattern\n  /Matrix [ 1 0 0 1 0 0 ]\n"
+        "  /Shading <<\n    /ShadingType 2\n    /Coords [0 0 [1 2] 1.5]\n"
+        "    /Extend [ true false ]\n  >>\n  /PatternType 2\n>>"
+    )
+    assert parsed == {
+        "Type": "Pattern",
+        "Matrix": [1, 0, 0, 1, 0, 0],
+        "Shading": {"ShadingType": 2, "Coords": [0, 0, [1, 2], 1.5], "Extend": [True, False]},
+        "PatternType": 2,
+    }
+
+
+def test_indirect_references():
+    parsed = _parse_pdf_dict("<</Function 12 0 R/Functions[4 0 R 5 0 R 7]/N 1>>")
+    assert parsed == {"Function": 12, "Functions": [4, 5, 7], "N": 1}
+
+
+def test_strings_are_skipped():
+    parsed = _parse_pdf_dict(
+        r"<</A (a \) (nested (parens)) \\) /B 1 /C <4142> /D <</E (>>)>> /F 2>>"
+    )
+    assert parsed == {"A": None, "B": 1, "C": None, "D": {"E": None}, "F": 2}
+
+
+def test_name_escapes():
+    parsed = _parse_pdf_dict("<</A#20B /C#23D /E#2fF 1>>")
+    assert parsed == {"A B": "C#D", "E/F": 1}
+
+
+def test_comments():
+    assert _parse_pdf_dict("<< /A 1 % comment /B 2\n /C 3 >>") == {"A": 1, "C": 3}
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("", {}),
+        ("12 0 obj\nnull\nendobj", {}),
+        ("<< /A 1 /B [1 2", {"A": 1, "B": [1, 2]}),
+        ("<< /A << /B >> /C 1 >>", {"A": {"B": None}, "C": 1}),
+        ("<< /A 1 2 /B 3 >>", {"A": 1, "B": 3}),
+        ("<< /A ] /B } /C 1 >>", {"A": None, "B": None, "C": 1}),
+        ("<< /A (unterminated", {"A": None}),
+        ("<< /A <41", {"A": None}),
+    ],
+)
+def test_malformed(source, expected):
+    assert _parse_pdf_dict(source) == expected
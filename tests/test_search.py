@@ -0,0 +1,66 @@
+"""
+Tests for PyMuPDFPage.search_text case and whole-word filtering.
+"""
+
+import pytest
+
+pymupdf = pytest.importorskip("pymupdf")
+pytest.importorskip("flet")
+
+from flet_pdf_viewer.backends.pymupdf import PyMuPDFBackend  # noqa: E402
+
+
+def _make_backend(lines, fontname="helv", fontbuffer=None):
+    """Build a one-page document with one text line per entry."""
+    doc = pymupdf.open()
+    page = doc.new_page()
+    if fontbuffer is not None:
+        page.insert_font(fontname=fontname, fontbuffer=fontbuffer)
+    for i, line in enumerate(lines):
+        page.insert_text((72, 100 + i * 15), line, fontsize=12, fontname=fontname)
+    data = doc.tobytes()
+    doc.close()
+    return PyMuPDFBackend(data)
+
+
+@pytest.fixture
+def page():
+    backend = _make_backend(["the quick foo", "bar Foo foobar"])
+    yield backend.get_page(0)
+    backend.close()
+
+
+def test_whole_word_skips_partial_words(page):
+    results = page.search_text("foo", whole_word=True)
+    # "foo" and "Foo", but not the start of "foobar"
+    assert len(results) == 2
+    assert all(r.rect[2] - r.rect[0] < 30 for r in results)
+
+
+def test_case_sensitive(page):
+    results = page.search_text("Foo", case_sensitive=True)
+    assert len(results) == 1
+    assert results[0].rect[1] > 100  # on the second line
+
+
+def test_match_wrapped_across_lines(page):
+    # search_for returns one hit per line for a match across a line break;
+    # both have to survive the filter
+    results = page.search_text("foo bar", whole_word=True)
+    assert len(results) == 2
+    assert results[0].rect[1] < results[1].rect[1]
+
+    results = page.search_text("FOO bar", case_sensitive=True)
+    assert len(results) == 1  # only the "bar" half matches its case
+
+
+def test_ligature():
+    buffer = pymupdf.Font("cjk").buffer
+    backend = _make_backend(["we ﬁnd the ﬁndings"], "F0", buffer)
+    try:
+        page = backend.get_page(0)
+        assert len(page.search_text("find")) == 2
+        assert len(page.search_text("find", whole_word=True)) == 1
+        assert len(page.search_text("find", case_sensitive=True)) == 2
+    finally:
+        backend.close()
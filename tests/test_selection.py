@@ -0,0 +1,96 @@
+"""
+Tests for SelectionHandler's hit-testing through its line index.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("flet")
+
+from flet_pdf_viewer.interactions.selection import SelectionHandler  # noqa: E402
+from flet_pdf_viewer.types import SelectableChar  # noqa: E402
+
+
+def _reference(chars, x1, y1, x2, y2):
+    """Linear scan over every char, as selection worked before the index."""
+    if x2 - x1 < 0.5 and y2 - y1 < 0.5:
+        return []
+    direct = [
+        i
+        for i, c in enumerate(chars)
+        if x1 < c.abs_x + c.width and x2 > c.abs_x and y1 < c.abs_y + c.height and y2 > c.abs_y
+    ]
+    if not direct:
+        return []
+    first_key = min(chars[i].y_key for i in direct)
+    last_key = max(chars[i].y_key for i in direct)
+    if first_key == last_key:
+        return direct
+    first_x = min(chars[i].abs_x for i in direct if chars[i].y_key == first_key)
+    last_x = max(chars[i].abs_x + chars[i].width for i in direct if chars[i].y_key == last_key)
+    return [
+        i
+        for i, c in enumerate(chars)
+        if first_key < c.y_key < last_key
+        or (c.y_key == first_key and c.abs_x >= first_x - 1)
+        or (c.y_key == last_key and c.abs_x + c.width <= last_x + 1)
+    ]
+
+
+def _make_chars(rng):
+    """Two pages of ragged lines with mixed sizes, some glyphs zero-size."""
+    chars = []
+    for page in range(2):
+        offset_y = page * 900.0
+        for line in range(30):
+            x = 20.0 + rng.random() * 5
+            y = 30 + line * 14.0 + rng.random()
+            for k in range(rng.randint(0, 40)):
+                width = 0.0 if rng.random() < 0.05 else 5 + rng.random() * 3
+                height = rng.choice((0.0, 9.0, 12.0, 18.0))
+                chars.append(SelectableChar(chr(97 + k % 26), x, y, width, height, page, 0.0, offset_y))
+                x += width + (5 if rng.random() < 0.15 else 0.3)
+    if rng.random() < 0.5:
+        rng.shuffle(chars)
+    return chars
+
+
+def test_matches_linear_scan():
+    rng = random.Random(1)
+    for _ in range(200):
+        chars = _make_chars(rng)
+        handler = SelectionHandler()
+        handler.set_selectable_chars(chars)
+        sx, sy = rng.uniform(0, 300), rng.uniform(0, 1400)
+        handler.start_selection(sx, sy)
+        for _ in range(3):
+            ex, ey = sx + rng.uniform(-150, 250), sy + rng.uniform(-60, 200)
+            handler.update_selection(ex, ey)
+            rect = (min(sx, ex), min(sy, ey), max(sx, ex), max(sy, ey))
+            expected = [chars[i] for i in _reference(chars, *rect)]
+            assert [id(c) for c in handler.selected_chars] == [id(c) for c in expected]
+
+
+def test_multi_line_extends_to_line_edges():
+    text = ["abcdef", "ghijkl", "mnopqr"]
+    chars = [
+        SelectableChar(ch, 10 + col * 6, 10 + row * 14, 5, 10, 0)
+        for row, line in enumerate(text)
+        for col, ch in enumerate(line)
+    ]
+    handler = SelectionHandler()
+    handler.set_selectable_chars(chars)
+    # From inside "c" on the first line to inside "o" on the last
+    handler.start_selection(23, 15)
+    handler.update_selection(25, 43)
+    assert handler.selected_text == "cdef\nghijkl\nmno"
+
+
+def test_click_selects_nothing():
+    chars = [SelectableChar("a", 10, 10, 5, 10, 0)]
+    handler = SelectionHandler()
+    handler.set_selectable_chars(chars)
+    handler.start_selection(12, 15)
+    handler.update_selection(12.2, 15.2)
+    assert handler.selected_chars == []
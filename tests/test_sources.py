@@ -0,0 +1,54 @@
+"""
+Tests for the in-memory sources PyMuPDFBackend accepts.
+"""
+
+import io
+
+import pytest
+
+pymupdf = pytest.importorskip("pymupdf")
+pytest.importorskip("flet")
+
+from flet_pdf_viewer.backends.pymupdf import PyMuPDFBackend  # noqa: E402
+
+
+@pytest.fixture
+def pdf_bytes():
+    doc = pymupdf.open()
+    doc.new_page()
+    doc.new_page()
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_bytesio_stays_usable(pdf_bytes):
+    stream = io.BytesIO(pdf_bytes)
+    backend = PyMuPDFBackend(stream)
+    try:
+        assert backend.page_count == 2
+        assert backend.source_size == len(pdf_bytes)
+        # The caller's stream is not pinned by the open document
+        stream.write(b"more")
+        stream.truncate(0)
+        stream.close()
+        assert backend.page_count == 2
+    finally:
+        backend.close()
+
+
+def test_memoryview_of_other_format(pdf_bytes):
+    # Wider items than bytes: the size must still count bytes
+    padded = pdf_bytes + b"\0" * (-len(pdf_bytes) % 4)
+    view = memoryview(padded).cast("I")
+    backend = PyMuPDFBackend(view)
+    try:
+        assert backend.page_count == 2
+        assert backend.source_size == len(padded)
+    finally:
+        backend.close()
+
+
+def test_non_contiguous_memoryview_rejected(pdf_bytes):
+    with pytest.raises(TypeError):
+        PyMuPDFBackend(memoryview(pdf_bytes)[::2])
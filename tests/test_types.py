@@ -0,0 +1,37 @@
+"""
+Tests for the shared data types.
+"""
+
+from array import array
+
+from flet_pdf_viewer.types import GraphicsInfo
+
+
+def test_path_commands_from_flat_form():
+    gfx = GraphicsInfo(
+        "path",
+        (0, 0, 10, 10),
+        path_ops="mclh",
+        path_coords=array("d", [0, 0, 1, 2, 3, 4, 5, 6, 10, 10]),
+    )
+    expected = [
+        ("m", 0, 0),
+        ("c", 1, 2, 3, 4, 5, 6),
+        ("l", 10, 10),
+        ("h",),
+    ]
+    assert gfx.path_commands == expected
+    assert list(gfx.iter_path_commands()) == expected
+
+
+def test_path_commands_given_directly():
+    commands = [("m", 0, 0), ("l", 1, 1)]
+    gfx = GraphicsInfo("path", (0, 0, 1, 1), path_commands=commands)
+    assert gfx.path_commands is commands
+    assert list(gfx.iter_path_commands()) == commands
+
+    # Assigning replaces the flat form as well
+    gfx = GraphicsInfo("path", (0, 0, 1, 1), path_ops="m", path_coords=array("d", [0, 0]))
+    gfx.path_commands = commands
+    assert gfx.path_ops is None
+    assert list(gfx.iter_path_commands()) == commands